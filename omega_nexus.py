@@ -5,6 +5,7 @@ Main entry point that integrates all system modules.
 """
 
 import sys
+import io
 import json
 import time
 import os
@@ -17,10 +18,15 @@ import threading
 from queue import Queue
 import traceback
 
+# Built once so the interactive loop does an O(1) frozenset probe per command
+_EXIT_COMMANDS = frozenset({"exit", "quit", "q"})
+
 
 class OmegaNexus:
     """Central orchestrator for the JAIDA-OMEGA-SAIOS platform"""
-    
+
+    __slots__ = ("start_time", "config", "modules", "command_queue", "running", "db")
+
     def __init__(self, config_path: str = "nexus_config.json"):
         self.start_time = datetime.now()
         print(f"🏛️  OMEGA_NEXUS Initializing at {self.start_time}")
@@ -154,23 +160,28 @@ class OmegaNexus:
             
     def _cmd_status(self, args: List[str]) -> bool:
         """Show system status"""
-        print("\n📊 OMEGA_NEXUS STATUS REPORT")
-        print("-" * 40)
-        print(f"System: {self.config.get('system_name')}")
-        print(f"Uptime: {datetime.now() - self.start_time}")
-        print(f"Modules loaded: {len([m for m in self.modules.values() if 'module' in m])}")
-        print(f"Modules with errors: {len([m for m in self.modules.values() if 'error' in m])}")
-        
+        # Buffer the whole report and emit it with a single write so piped
+        # or scripted usage isn't serialized by per-line flushes
+        buf = io.StringIO()
+        buf.write("\n📊 OMEGA_NEXUS STATUS REPORT\n")
+        buf.write("-" * 40 + "\n")
+        buf.write(f"System: {self.config.get('system_name')}\n")
+        buf.write(f"Uptime: {datetime.now() - self.start_time}\n")
+        buf.write(f"Modules loaded: {len([m for m in self.modules.values() if 'module' in m])}\n")
+        buf.write(f"Modules with errors: {len([m for m in self.modules.values() if 'error' in m])}\n")
+
         # Run quick test of all components
-        print("\n🧪 Quick Component Check:")
+        buf.write("\n🧪 Quick Component Check:\n")
         for name, info in self.modules.items():
             if "module" in info:
-                print(f"  ✅ {name:15} - LOADED")
+                buf.write(f"  ✅ {name:15} - LOADED\n")
             elif "error" in info:
-                print(f"  ❌ {name:15} - ERROR: {info['error']}")
+                buf.write(f"  ❌ {name:15} - ERROR: {info['error']}\n")
             else:
-                print(f"  ⚠️  {name:15} - UNKNOWN STATE")
-                
+                buf.write(f"  ⚠️  {name:15} - UNKNOWN STATE\n")
+
+        sys.stdout.write(buf.getvalue())
+        sys.stdout.flush()
         return True
         
     def _cmd_test(self, args: List[str]) -> bool:
@@ -197,8 +208,7 @@ class OmegaNexus:
             
     def _cmd_deploy(self, args: List[str]) -> bool:
         """Deploy bots via BotFather"""
-        print("
-🤖 Deploying bot fleet...")
+        print("\n🤖 Deploying bot fleet...")
         
         bot_father = self.get_module("bot_father")
         if bot_father and hasattr(bot_father, "BotFather"):
@@ -242,9 +252,6 @@ class OmegaNexus:
         else:
             print("❌ Bot Father module not available")
             return False
-        else:
-            print("❌ Bot Father module not available")
-            return False
             
     def _cmd_crawl(self, args: List[str]) -> bool:
         """Execute web crawling"""
@@ -306,17 +313,19 @@ class OmegaNexus:
         """Start interactive command mode"""
         print("\n💻 OMEGA_NEXUS Interactive Mode")
         print("Commands: status, test, deploy, crawl, dashboard, exit")
-        
+
         while self.running:
             try:
-                cmd_input = input("\nnexus> ").strip().split()
-                if not cmd_input:
+                raw = input("\nnexus> ")
+                # Short-circuit blank lines before paying for split/lower
+                if not raw or raw.isspace():
                     continue
-                    
+
+                cmd_input = raw.split()
                 command = cmd_input[0].lower()
-                args = cmd_input[1:] if len(cmd_input) > 1 else []
-                
-                if command == "exit":
+                args = cmd_input[1:]
+
+                if command in _EXIT_COMMANDS:
                     print("👋 Exiting OMEGA_NEXUS")
                     self.running = False
                 else:
@@ -6,9 +6,6 @@ Usage: python -m omega_platform [command] [options]
 
 import sys
 import argparse
-from omega_platform.core.engine import OmegaEngine
-from omega_platform.core.config_loader import load_config
-from omega_platform.core.logging_setup import setup_logging
 
 def start_dashboard(args):
     """Start the simulation dashboard"""
@@ -33,6 +30,12 @@ def start_dashboard(args):
 
 def main():
     """Main entry point for Omega Platform"""
+    # Fast path: `python -m omega_platform version` skips argparse and the
+    # engine entirely, so trivial invocations don't pay startup cost
+    if len(sys.argv) == 2 and sys.argv[1] == "version":
+        print("Omega Platform v3.0.0")
+        return 0
+
     parser = argparse.ArgumentParser(description="Omega Security Platform")
     parser.add_argument("--config", "-c", default="config/defaults.yaml",
                        help="Configuration file path")
@@ -64,7 +67,12 @@ def main():
     dashboard_parser.add_argument('--debug', action='store_true', help='Enable debug mode')
     
     args = parser.parse_args()
-    
+
+    # Heavy imports happen only once we know we need the full platform
+    from omega_platform.core.engine import OmegaEngine
+    from omega_platform.core.config_loader import load_config
+    from omega_platform.core.logging_setup import setup_logging
+
     # Setup logging first
     setup_logging()
     
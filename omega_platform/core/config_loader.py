@@ -49,6 +49,9 @@ class ConfigLoader:
         env_vars = self._load_environment_vars()
         self._merge_configs(self.config, env_vars)
         
+        # Record the active environment so consumers don't need it passed separately
+        self.config.setdefault("platform", {})["environment"] = env
+
         logger.info(f"Configuration loaded for environment: {env}")
         return self.config
     
@@ -128,9 +131,29 @@ class ConfigLoader:
         
         for env_var, config_path in env_mappings.items():
             if env_var in os.environ:
-                self._set_nested(config, config_path, os.environ[env_var])
-        
+                value = self._coerce_type(config_path, os.environ[env_var])
+                self._set_nested(config, config_path, value)
+
         return config
+
+    def _coerce_type(self, config_path: list, raw: str) -> Any:
+        """Convert an environment variable string to the default value's type"""
+        default = self.config
+        for key in config_path:
+            if not isinstance(default, dict) or key not in default:
+                return raw
+            default = default[key]
+
+        try:
+            if isinstance(default, bool):
+                return raw.lower() in ("1", "true", "yes", "on")
+            if isinstance(default, int):
+                return int(raw)
+            if isinstance(default, float):
+                return float(raw)
+        except ValueError:
+            logger.warning(f"Invalid value for {'.'.join(config_path)}: {raw!r}, keeping as string")
+        return raw
     
     def _merge_configs(self, base: Dict[str, Any], overlay: Dict[str, Any]):
         """Recursively merge two dictionaries"""
@@ -2,37 +2,96 @@
 Omega Engine - Core orchestration engine
 """
 import os
+import sched
 import sys
+import threading
+import time
 import logging
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Callable, Optional, List
 from datetime import datetime
 from pathlib import Path
 
-from omega_platform.core.config_loader import ConfigLoader
-from omega_platform.core.logging_setup import setup_logging
+from omega_platform.core.config_loader import load_config
 
 class OmegaEngine:
     """Main engine orchestrating all platform components."""
-    
-    def __init__(self, env: str = "development"):
-        """Initialize Omega Engine with environment."""
-        self.env = env
-        self.config_loader = ConfigLoader(env)
-        self.config = self.config_loader.load_config()
-        
-        # Setup logging
-        self.logger = setup_logging(
-            name="OmegaEngine",
-            level=self.config.get("logging", {}).get("level", "INFO"),
-            log_file=self.config.get("logging", {}).get("file", "omega_platform.log")
-        )
-        
+
+    __slots__ = ("config", "env", "logger", "modules", "_is_running",
+                 "_scheduler", "_scheduler_thread", "_scheduler_wakeup",
+                 "_scheduler_lock")
+
+    def __init__(self, config: Dict[str, Any]):
+        """Initialize Omega Engine with an already-loaded configuration dict."""
+        self.config = config
+        self.env = config.get("platform", {}).get("environment", "development")
+        self.logger = logging.getLogger("OmegaEngine")
+
         # Initialize modules
         self.modules: Dict[str, Any] = {}
         self._is_running = False
-        
-        self.logger.info(f"Omega Engine initialized for environment: {env}")
+
+        # One shared scheduler thread serves every module's periodic
+        # callbacks; created lazily on the first schedule() call
+        self._scheduler = None
+        self._scheduler_thread = None
+        self._scheduler_wakeup = threading.Event()
+        self._scheduler_lock = threading.Lock()
+
+        self.logger.info(f"Omega Engine initialized for environment: {self.env}")
+
+    def reload_config(self, config_file: Optional[str] = None) -> Dict[str, Any]:
+        """Re-load configuration on demand and replace the active config."""
+        self.config = load_config(config_file, self.env)
+        self.logger.info("Configuration reloaded")
+        return self.config
     
+    def schedule(self, interval: float, callback: Callable[[], Any]) -> Callable[[], None]:
+        """Run callback every interval seconds on the shared scheduler thread.
+
+        Returns a cancel function. All modules share one background
+        thread instead of each spawning their own sleeping thread.
+        """
+        with self._scheduler_lock:
+            if self._scheduler is None:
+                self._scheduler = sched.scheduler(time.monotonic,
+                                                  self._interruptible_delay)
+                self._scheduler_thread = threading.Thread(
+                    target=self._run_scheduler_loop,
+                    daemon=True,
+                    name="omega-scheduler",
+                )
+                self._scheduler_thread.start()
+
+        cancelled = threading.Event()
+
+        def _tick():
+            if cancelled.is_set():
+                return
+            try:
+                callback()
+            except Exception as e:
+                self.logger.error(f"Scheduled callback failed: {e}")
+            if not cancelled.is_set():
+                self._scheduler.enter(interval, 1, _tick)
+
+        self._scheduler.enter(interval, 1, _tick)
+        self._scheduler_wakeup.set()
+        return cancelled.set
+
+    def _interruptible_delay(self, timeout):
+        """delayfunc for the shared scheduler: sleeps like time.sleep
+        but wakes as soon as schedule() enters a new event, so a short
+        interval is never stuck behind a longer sleep already running"""
+        if self._scheduler_wakeup.wait(timeout):
+            self._scheduler_wakeup.clear()
+
+    def _run_scheduler_loop(self):
+        """Drain the shared scheduler, sleeping until new events arrive."""
+        while True:
+            self._scheduler.run(blocking=True)
+            self._scheduler_wakeup.wait()
+            self._scheduler_wakeup.clear()
+
     def load_module(self, module_name: str) -> bool:
         """Dynamically load a module."""
         try:
@@ -132,11 +191,14 @@ class OmegaEngine:
             },
             "modules": module_statuses,
             "config": {
-                "environment": self.env,
-                "config_file": self.config_loader.config_path
+                "environment": self.env
             }
         }
     
+    def get_version(self) -> str:
+        """Get platform version from configuration."""
+        return self.config.get("platform", {}).get("version", "3.0.0")
+
     def run_simulation(self, scenario: str, intensity: str = "medium") -> Dict[str, Any]:
         """Run a simulation scenario."""
         if "simulation" not in self.modules:
@@ -176,4 +238,4 @@ class OmegaEngine:
 
 def create_engine(env: str = "development") -> OmegaEngine:
     """Factory function to create Omega Engine instance."""
-    return OmegaEngine(env)
+    return OmegaEngine(load_config(env=env))
@@ -3,34 +3,164 @@ import os
 Structured JSON logging setup for Omega Platform
 """
 
+import atexit
+import io
 import logging
+import logging.handlers
 import json
+import queue
 import sys
+import threading
+import time
 from datetime import datetime
-from pythonjsonlogger import jsonlogger
 
-class StructuredJsonFormatter(jsonlogger.JsonFormatter):
-    """Custom JSON formatter for structured logging"""
-    
-    def add_fields(self, log_record, record, message_dict):
-        super().add_fields(log_record, record, message_dict)
-        
-        # Add standard fields
-        log_record['timestamp'] = datetime.utcnow().isoformat() + 'Z'
-        log_record['level'] = record.levelname
-        log_record['logger'] = record.name
-        
-        # Add process/thread info
-        log_record['pid'] = record.process
-        log_record['thread'] = record.threadName
-        
-        # Remove default fields we don't want
-        log_record.pop('message', None)
-        log_record.pop('asctime', None)
-        
-        # Rename msg to message
-        if 'msg' in log_record:
-            log_record['message'] = log_record.pop('msg')
+try:
+    from pythonjsonlogger import jsonlogger
+except ImportError:  # only needed for the legacy formatter
+    jsonlogger = None
+
+try:
+    import orjson
+except ImportError:  # optional native-speed encoder
+    orjson = None
+
+
+class FastJsonFormatter(logging.Formatter):
+    """Fixed-shape JSON formatter for the hot logging path.
+
+    Builds the output dict directly instead of going through
+    jsonlogger's per-record format-string reflection, and reuses
+    record.created rather than calling utcnow() again.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._utcfromtimestamp = datetime.utcfromtimestamp
+
+    def format(self, record):
+        entry = {
+            'timestamp': self._utcfromtimestamp(record.created).isoformat() + 'Z',
+            'level': record.levelname,
+            'logger': record.name,
+            'pid': record.process,
+            'thread': record.threadName,
+            'message': record.getMessage(),
+        }
+        if record.exc_info:
+            entry['exc'] = self.formatException(record.exc_info)
+        if orjson is not None:
+            return orjson.dumps(entry, default=str).decode()
+        return json.dumps(entry, separators=(',', ':'), default=str)
+
+
+if jsonlogger is not None:
+    class StructuredJsonFormatter(jsonlogger.JsonFormatter):
+        """Legacy jsonlogger-based formatter (kept for compatibility)"""
+
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            # add_fields runs per record; bind the hot callables once so each
+            # call skips module/attribute lookups, and derive the timestamp
+            # from time.time() instead of the much slower datetime.utcnow()
+            self._time = time.time
+            self._utcfromtimestamp = datetime.utcfromtimestamp
+
+        def add_fields(self, log_record, record, message_dict):
+            super().add_fields(log_record, record, message_dict)
+
+            # Add standard fields
+            log_record['timestamp'] = self._utcfromtimestamp(self._time()).isoformat() + 'Z'
+            log_record['level'] = record.levelname
+            log_record['logger'] = record.name
+
+            # Add process/thread info
+            log_record['pid'] = record.process
+            log_record['thread'] = record.threadName
+
+            # Remove default fields we don't want
+            log_record.pop('message', None)
+            log_record.pop('asctime', None)
+
+            # Rename msg to message
+            if 'msg' in log_record:
+                log_record['message'] = log_record.pop('msg')
+
+        if orjson is not None:
+            def jsonify_log_record(self, log_record):
+                """Serialize the record with orjson when it's installed"""
+                return orjson.dumps(
+                    log_record, default=str, option=orjson.OPT_NON_STR_KEYS
+                ).decode()
+
+class RawQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler that defers all formatting to the listener thread.
+
+    The stdlib prepare() formats the record inline on the application
+    thread, which pulls the JSON serialization cost back onto the hot
+    path. Here only the message is resolved (so mutable args can't
+    change after enqueue) and the raw record is passed through; the
+    listener-side handlers run StructuredJsonFormatter on their own
+    thread.
+    """
+
+    def prepare(self, record):
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+
+class BufferedFileHandler(logging.Handler):
+    """File handler that batches records in a 128 KB buffer.
+
+    Small per-record writes cap log throughput; buffering collapses them
+    into large writes. The buffer is flushed by a background thread every
+    30 seconds and immediately for ERROR/CRITICAL records so urgent
+    output is never stuck in the buffer.
+    """
+
+    FLUSH_INTERVAL = 30.0
+    BUFFER_SIZE = 128 * 1024
+
+    def __init__(self, filename: str):
+        super().__init__()
+        raw = open(filename, 'ab', buffering=0)
+        self.stream = io.BufferedWriter(raw, self.BUFFER_SIZE)
+        self._flusher = threading.Thread(
+            target=self._flush_loop, name="log-flusher", daemon=True
+        )
+        self._stop_event = threading.Event()
+        self._flusher.start()
+
+    def emit(self, record):
+        try:
+            msg = self.format(record)
+            with self.lock:
+                self.stream.write(msg.encode('utf-8', errors='replace') + b'\n')
+                if record.levelno >= logging.ERROR:
+                    self.stream.flush()
+        except Exception:
+            self.handleError(record)
+
+    def flush(self):
+        with self.lock:
+            if not self.stream.closed:
+                self.stream.flush()
+
+    def _flush_loop(self):
+        while not self._stop_event.wait(self.FLUSH_INTERVAL):
+            try:
+                self.flush()
+            except ValueError:
+                break
+
+    def close(self):
+        self._stop_event.set()
+        try:
+            self.flush()
+            self.stream.close()
+        finally:
+            super().close()
+
 
 def setup_logging(log_level: str = "INFO", json_format: bool = True):
     """
@@ -57,9 +187,7 @@ def setup_logging(log_level: str = "INFO", json_format: bool = True):
     
     if json_format:
         # JSON format for structured logging
-        formatter = StructuredJsonFormatter(
-            '%(timestamp)s %(level)s %(logger)s %(message)s'
-        )
+        formatter = FastJsonFormatter()
     else:
         # Plain text format for development
         formatter = logging.Formatter(
@@ -68,20 +196,27 @@ def setup_logging(log_level: str = "INFO", json_format: bool = True):
         )
     
     console_handler.setFormatter(formatter)
-    root_logger.addHandler(console_handler)
-    
+
     # Create file handler for JSON logs (always JSON)
+    handlers = [console_handler]
     try:
         os.makedirs("logs", exist_ok=True)
-        file_handler = logging.FileHandler("logs/omega_platform.log")
-        file_formatter = StructuredJsonFormatter(
-            '%(timestamp)s %(level)s %(logger)s %(message)s'
-        )
-        file_handler.setFormatter(file_formatter)
-        root_logger.addHandler(file_handler)
+        file_handler = BufferedFileHandler("logs/omega_platform.log")
+        file_handler.setFormatter(FastJsonFormatter())
+        handlers.append(file_handler)
     except Exception as e:
         print(f"Warning: Could not setup file logging: {e}")
-    
+
+    # Route records through a queue so application threads only enqueue;
+    # the listener thread does the actual console/file writes
+    log_queue = queue.Queue(-1)
+    root_logger.addHandler(RawQueueHandler(log_queue))
+    listener = logging.handlers.QueueListener(
+        log_queue, *handlers, respect_handler_level=True
+    )
+    listener.start()
+    atexit.register(listener.stop)
+
     # Set specific loggers to higher/lower levels
     logging.getLogger("urllib3").setLevel(logging.WARNING)
     logging.getLogger("werkzeug").setLevel(logging.WARNING)
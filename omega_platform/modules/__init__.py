@@ -1 +1,52 @@
 # Modules Package
+
+import os
+from datetime import datetime
+from typing import Any, Dict
+
+# Pre-bound for the frequently polled health_check path
+_utcnow = datetime.utcnow
+
+# Directories already created this process; skips the mkdir syscall
+# that modules would otherwise re-issue on every construction
+_ENSURED_DIRS = set()
+
+
+def ensure_dir(path):
+    """os.makedirs(..., exist_ok=True) with a process-wide seen-set"""
+    path = str(path)
+    if path in _ENSURED_DIRS:
+        return
+    os.makedirs(path, exist_ok=True)
+    _ENSURED_DIRS.add(path)
+
+
+class BaseModule:
+    """Base class for all platform modules"""
+
+    def __init__(self, config: Dict[str, Any], engine=None):
+        self.config = config or {}
+        self.engine = engine
+        self.running = False
+
+    def start(self):
+        """Start the module"""
+        self.running = True
+
+    def stop(self):
+        """Stop the module"""
+        self.running = False
+
+    def status(self) -> Dict[str, Any]:
+        """Get basic module status"""
+        return {
+            "module": self.__class__.__name__,
+            "running": self.running,
+        }
+
+    def health_check(self) -> Dict[str, Any]:
+        """Basic health check"""
+        return {
+            "healthy": self.running,
+            "timestamp": _utcnow().isoformat(),
+        }
@@ -2,10 +2,18 @@
 MITRE ATT&CK Matrix Visualization for Omega Platform
 """
 import json
+from bisect import bisect_right
 from typing import Dict, List
 from collections import defaultdict
 
+# Heatmap color table indexed via bisect: no coverage, <0.3, <0.6, >=0.6
+_INTENSITY_CUTOFFS = (1e-12, 0.3, 0.6)
+_INTENSITY_COLORS = ('#f0f0f0', '#ffcccc', '#ff6666', '#ff0000')
+
 class AttackMatrix:
+    # Techniques every coverage plan should include
+    _CRITICAL_TECHNIQUES = frozenset({'T1190', 'T1059', 'T1078', 'T1566', 'T1486'})
+
     def __init__(self, mitre_module=None):
         self.tactics = [
             'Reconnaissance', 'Resource Development', 'Initial Access',
@@ -27,58 +35,78 @@ class AttackMatrix:
         }
         
         self.mitre = mitre_module
-    
-    def generate_matrix(self, scenarios: List[Dict]) -> Dict:
-        """Generate ATT&CK coverage matrix for scenarios"""
-        coverage = {}
-        
-        # Initialize coverage matrix
-        for tactic in self.tactics:
-            coverage[tactic] = {}
-        
-        # Count technique usage in scenarios
+
+        # Per-instance technique->tactics cache; repeated generate_matrix
+        # calls hit the dict instead of re-querying the MITRE module.
+        # Instance-level so swapping self.mitre means building a new matrix
+        self._tactics_cache = {}
+
+        # Inverted tactic->techniques index built once from the mappings
+        self._tactic_to_techniques = defaultdict(list)
+        for tech_id, tactics in self.technique_mappings.items():
+            for tactic in tactics:
+                self._tactic_to_techniques[tactic].append(tech_id)
+
+    def _scan(self, scenarios: List[Dict]):
+        """Single pass over scenarios for all coverage consumers.
+
+        Returns (coverage matrix, set of used techniques, per-technique
+        usage counts) so callers don't each re-iterate the scenario list.
+        """
+        coverage = {tactic: {} for tactic in self.tactics}
+        all_techniques = set()
+        technique_counts = {}
+
         for scenario in scenarios:
-            techniques = scenario.get('mitre_techniques', [])
-            for tech_id in techniques:
-                tactics = self._get_tactics_for_technique(tech_id)
-                for tactic in tactics:
+            for tech_id in scenario.get('mitre_techniques', []):
+                all_techniques.add(tech_id)
+                technique_counts[tech_id] = technique_counts.get(tech_id, 0) + 1
+                for tactic in self._get_tactics_for_technique(tech_id):
                     if tactic in coverage:
                         coverage[tactic][tech_id] = coverage[tactic].get(tech_id, 0) + 1
-        
-        return coverage
+
+        return coverage, all_techniques, technique_counts
+
+    def generate_matrix(self, scenarios: List[Dict]) -> Dict:
+        """Generate ATT&CK coverage matrix for scenarios"""
+        return self._scan(scenarios)[0]
     
     def _get_tactics_for_technique(self, technique_id: str) -> List[str]:
-        """Get tactics for a technique"""
+        """Get tactics for a technique (cached per instance)"""
+        tactics = self._tactics_cache.get(technique_id)
+        if tactics is not None:
+            return tactics
+
         if self.mitre and hasattr(self.mitre, 'get_technique'):
             tech = self.mitre.get_technique(technique_id)
             if tech and 'tactics' in tech:
+                self._tactics_cache[technique_id] = tech['tactics']
                 return tech['tactics']
-        
+
         # Fallback to our mapping
-        return self.technique_mappings.get(technique_id, ['Unknown'])
+        tactics = self.technique_mappings.get(technique_id, ['Unknown'])
+        self._tactics_cache[technique_id] = tactics
+        return tactics
     
     def get_coverage_stats(self, scenarios: List[Dict]) -> Dict:
         """Get coverage statistics"""
-        matrix = self.generate_matrix(scenarios)
-        
-        total_techniques_covered = 0
+        matrix, all_techniques, _ = self._scan(scenarios)
+        return self._stats_from_matrix(scenarios, matrix, all_techniques)
+
+    def _stats_from_matrix(self, scenarios: List[Dict], matrix: Dict,
+                           all_techniques: set) -> Dict:
+        """Build the coverage-stats payload from a completed scan"""
         tactic_coverage = {}
-        
+
         for tactic, techniques in matrix.items():
-            covered = len([t for t in techniques.values() if t > 0])
+            covered = sum(1 for t in techniques.values() if t > 0)
             total = len(techniques) if techniques else 1  # Avoid division by zero
             tactic_coverage[tactic] = {
                 'covered': covered,
                 'total': total,
                 'percentage': (covered / total * 100) if total > 0 else 0
             }
-            total_techniques_covered += covered
-        
-        # Get unique techniques across all scenarios
-        all_techniques = set()
-        for scenario in scenarios:
-            all_techniques.update(scenario.get('mitre_techniques', []))
-        
+
         return {
             'total_scenarios': len(scenarios),
             'unique_techniques': len(all_techniques),
@@ -86,20 +114,23 @@ class AttackMatrix:
             'coverage_matrix': matrix,
             'all_techniques': list(all_techniques)
         }
-    
+
     def generate_visualization_data(self, scenarios: List[Dict]) -> Dict:
-        """Generate data for visualization"""
-        stats = self.get_coverage_stats(scenarios)
-        
+        """Generate data for visualization (single scenario pass)"""
+        matrix, used_techniques, _ = self._scan(scenarios)
+
         # Prepare data for heatmap
         heatmap_data = []
+        tactics_covered = 0
         for tactic in self.tactics:
             row = []
-            tactic_techs = stats['coverage_matrix'].get(tactic, {})
-            
+            tactic_techs = matrix.get(tactic, {})
+            if tactic_techs:
+                tactics_covered += 1
+
             # For visualization, we'll use the count as intensity
             max_count = max(tactic_techs.values()) if tactic_techs else 1
-            
+
             for tech_id, count in tactic_techs.items():
                 intensity = count / max_count if max_count > 0 else 0
                 row.append({
@@ -108,26 +139,22 @@ class AttackMatrix:
                     'intensity': intensity,
                     'color': self._get_color_for_intensity(intensity)
                 })
-            
+
             heatmap_data.append({
                 'tactic': tactic,
                 'techniques': row,
-                'total_coverage': len([t for t in tactic_techs.values() if t > 0])
+                'total_coverage': sum(1 for t in tactic_techs.values() if t > 0)
             })
-        
+
         # Identify gaps
         all_known_techniques = list(self.technique_mappings.keys())
-        used_techniques = set()
-        for scenario in scenarios:
-            used_techniques.update(scenario.get('mitre_techniques', []))
-        
         unused_techniques = [t for t in all_known_techniques if t not in used_techniques]
-        
+
         return {
             'heatmap': heatmap_data,
             'stats': {
                 'total_tactics': len(self.tactics),
-                'tactics_covered': len([t for t in stats['tactic_coverage'].values() if t['covered'] > 0]),
+                'tactics_covered': tactics_covered,
                 'techniques_covered': len(used_techniques),
                 'coverage_gaps': unused_techniques[:10],  # Top 10 gaps
                 'coverage_percentage': (len(used_techniques) / len(all_known_techniques) * 100) if all_known_techniques else 0
@@ -136,22 +163,16 @@ class AttackMatrix:
         }
     
     def _get_color_for_intensity(self, intensity: float) -> str:
-        """Get color for heatmap intensity"""
-        if intensity == 0:
-            return '#f0f0f0'  # Light gray for no coverage
-        elif intensity < 0.3:
-            return '#ffcccc'  # Light red
-        elif intensity < 0.6:
-            return '#ff6666'  # Medium red
-        else:
-            return '#ff0000'  # Bright red
+        """Get color for heatmap intensity (table lookup, no branching)"""
+        return _INTENSITY_COLORS[bisect_right(_INTENSITY_CUTOFFS, intensity)]
     
     def get_recommendations(self, scenarios: List[Dict]) -> List[Dict]:
         """Get recommendations based on coverage gaps"""
-        stats = self.get_coverage_stats(scenarios)
-        
+        matrix, all_techniques, _ = self._scan(scenarios)
+        stats = self._stats_from_matrix(scenarios, matrix, all_techniques)
+
         recommendations = []
-        
+
         # Check for tactic gaps
         for tactic, coverage in stats['tactic_coverage'].items():
             if coverage['covered'] == 0:
@@ -172,14 +193,9 @@ class AttackMatrix:
                     'suggestion': f'Add more scenarios to improve {tactic} coverage'
                 })
         
-        # Check for critical technique gaps
-        critical_techniques = ['T1190', 'T1059', 'T1078', 'T1566', 'T1486']
-        all_techniques = set()
-        for scenario in scenarios:
-            all_techniques.update(scenario.get('mitre_techniques', []))
-        
-        missing_critical = [t for t in critical_techniques if t not in all_techniques]
-        
+        # Check for critical technique gaps (set difference, no rescan)
+        missing_critical = sorted(self._CRITICAL_TECHNIQUES - all_techniques)
+
         for tech in missing_critical:
             recommendations.append({
                 'type': 'critical_technique_gap',
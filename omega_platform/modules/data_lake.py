@@ -1,21 +1,105 @@
 """
 Security Data Lake for Omega Platform v4.5
 """
+import atexit
 import json
 import os
+import threading
+from collections import Counter, deque
 from datetime import datetime
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:  # optional native-speed encoder
+    orjson = None
+
+if orjson is not None:
+    def _dumps(obj):
+        return orjson.dumps(obj).decode()
+    _loads = orjson.loads
+else:
+    def _dumps(obj):
+        return json.dumps(obj, separators=(",", ":"))
+    _loads = json.loads
+
+class _BatchedAppendWriter:
+    """Batch NDJSON lines into a single write per flush.
+
+    Crossing the syscall boundary once per batch instead of once per
+    event is what matters for bursty storage; pending lines are flushed
+    when the batch fills, before any read, and at interpreter exit.
+    """
+
+    def __init__(self, path, batch_size):
+        self.path = path
+        self.batch_size = batch_size
+        self._lines = []
+        self._lock = threading.Lock()
+        atexit.register(self.flush)
+
+    def write_line(self, line):
+        with self._lock:
+            self._lines.append(line)
+            if len(self._lines) >= self.batch_size:
+                self._flush_locked()
+
+    def flush(self):
+        with self._lock:
+            self._flush_locked()
+
+    def _flush_locked(self):
+        if not self._lines:
+            return
+        with open(self.path, 'a', buffering=64 * 1024) as f:
+            f.write("".join(self._lines))
+        self._lines.clear()
+
+
 class SecurityDataLake:
     def __init__(self):
         self.data_dir = Path("omega_platform/data/data_lake")
         self.data_dir.mkdir(parents=True, exist_ok=True)
-        self.events_file = self.data_dir / "security_events.json"
-        
+        # Append-only newline-delimited JSON: store_event is O(1) instead
+        # of rewriting the whole file per event
+        self.events_file = self.data_dir / "security_events.ndjson"
+
+        # Opt-in batched appends: one write() per N events instead of one
+        # per event (OMEGA_DATALAKE_BATCH_SIZE=16 is a reasonable start)
+        batch_size = int(os.environ.get("OMEGA_DATALAKE_BATCH_SIZE", "0") or 0)
+        self._writer = (_BatchedAppendWriter(self.events_file, batch_size)
+                        if batch_size > 1 else None)
+
+        # Migrate a legacy JSON-array file if one is present
+        legacy_file = self.data_dir / "security_events.json"
+        if not self.events_file.exists() and legacy_file.exists():
+            self._migrate_legacy_file(legacy_file)
+
         # Initialize with sample event if empty
         if not self.events_file.exists() or os.path.getsize(self.events_file) == 0:
             self._create_sample_events()
-    
+
+        # Monotonic event counter persisted in a sidecar file so ids are
+        # sequential without parsing the whole event log per write
+        self._seq_file = self.data_dir / "events.seq"
+        self._seq_lock = threading.Lock()
+        self._next_id = self._load_next_id()
+
+        # Total stored events, counted once at startup and bumped per
+        # write so handlers never len() the whole log
+        self._count = self._count_lines()
+
+    def _migrate_legacy_file(self, legacy_file):
+        """Convert the old JSON-array events file to NDJSON"""
+        try:
+            with open(legacy_file, 'r') as f:
+                events = json.load(f)
+        except (json.JSONDecodeError, OSError):
+            return
+        with open(self.events_file, 'w') as f:
+            for event in events:
+                f.write(_dumps(event) + "\n")
+
     def _create_sample_events(self):
         """Create sample security events"""
         sample_events = [
@@ -40,85 +124,135 @@ class SecurityDataLake:
                 "details": {"confidence": 0.85, "source_ip": "192.168.1.100"}
             }
         ]
-        
+
         with open(self.events_file, 'w') as f:
-            json.dump(sample_events, f, indent=2)
-    
+            for event in sample_events:
+                f.write(_dumps(event) + "\n")
+
+    def _load_next_id(self):
+        """Read the persisted counter, or rebuild it by counting lines"""
+        try:
+            with open(self._seq_file, 'rb') as f:
+                return int.from_bytes(f.read(8), 'little')
+        except (OSError, ValueError):
+            pass
+        if self.events_file.exists():
+            with open(self.events_file, 'rb') as f:
+                return 1 + sum(1 for _ in f)
+        return 1
+
+    def _count_lines(self):
+        """Count log lines once, without parsing any JSON"""
+        if self._writer is not None:
+            self._writer.flush()
+        try:
+            with open(self.events_file, 'rb') as f:
+                return sum(1 for _ in f)
+        except OSError:
+            return 0
+
+    def _persist_next_id(self):
+        """Atomically rewrite the sidecar counter file"""
+        tmp = self._seq_file.with_suffix('.seq.tmp')
+        with open(tmp, 'wb') as f:
+            f.write(self._next_id.to_bytes(8, 'little'))
+        os.replace(tmp, self._seq_file)
+
     def store_event(self, event_data):
-        """Store a new security event"""
-        events = self.get_all_events()
-        event_data["event_id"] = f"event_{len(events) + 1:03d}"
+        """Store a new security event (single appended line, O(1))"""
+        with self._seq_lock:
+            event_data["event_id"] = f"event_{self._next_id:06d}"
+            self._next_id += 1
+            self._count += 1
+            self._persist_next_id()
         event_data["timestamp"] = datetime.now().isoformat() + "Z"
-        
-        events.append(event_data)
-        
-        with open(self.events_file, 'w') as f:
-            json.dump(events, f, indent=2)
-        
+
+        line = _dumps(event_data) + "\n"
+        if self._writer is not None:
+            self._writer.write_line(line)
+        else:
+            with open(self.events_file, 'a', buffering=64 * 1024) as f:
+                f.write(line)
+
         return event_data["event_id"]
-    
-    def get_all_events(self):
-        """Get all security events"""
+
+    def _iter_events(self):
+        """Stream events from disk one line at a time"""
+        if self._writer is not None:
+            self._writer.flush()
         if not self.events_file.exists():
-            return []
-        
+            return
         with open(self.events_file, 'r') as f:
-            try:
-                return json.load(f)
-            except json.JSONDecodeError:
-                return []
-    
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    yield _loads(line)
+                except ValueError:
+                    continue
+
+    def get_all_events(self):
+        """Get all security events"""
+        return list(self._iter_events())
+
+    def iter_events(self, limit=None):
+        """Yield events without building the full list; with a limit,
+        only the last N parsed events are held at once. Non-positive
+        limits mean no cap (deque rejects a negative maxlen)."""
+        if limit is None or limit <= 0:
+            yield from self._iter_events()
+        else:
+            yield from deque(self._iter_events(), maxlen=limit)
+
+    def count(self):
+        """Total stored events, from the cached counter"""
+        return self._count
+
     def get_recent_events(self, limit=10):
-        """Get recent events"""
-        events = self.get_all_events()
-        return events[-limit:] if events else []
-    
+        """Get recent events (only the last N lines are kept in memory)"""
+        if limit is not None and limit <= 0:
+            limit = None  # non-positive limits mean no cap
+        return list(deque(self._iter_events(), maxlen=limit))
+
     def get_events_by_scenario(self, scenario_id):
         """Get events for a specific scenario"""
-        events = self.get_all_events()
-        return [e for e in events if e.get("scenario_id") == scenario_id]
-    
+        return [e for e in self._iter_events() if e.get("scenario_id") == scenario_id]
+
     def get_stats(self):
-        """Get data lake statistics"""
-        events = self.get_all_events()
-        
-        if not events:
+        """Get data lake statistics in a single streaming pass"""
+        event_types = Counter()
+        threat_levels = Counter()
+        scenarios = Counter()
+        total = 0
+        latest = None
+
+        for event in self._iter_events():
+            total += 1
+            latest = event
+            event_types[event.get("event_type", "unknown")] += 1
+            threat_levels[event.get("threat_level", "unknown")] += 1
+            scenarios[event.get("scenario_name", "unknown")] += 1
+
+        if not total:
             return {
                 "total_events": 0,
                 "event_types": {},
                 "threat_levels": {},
                 "scenarios": {}
             }
-        
-        # Calculate statistics
-        event_types = {}
-        threat_levels = {}
-        scenarios = {}
-        
-        for event in events:
-            # Count event types
-            etype = event.get("event_type", "unknown")
-            event_types[etype] = event_types.get(etype, 0) + 1
-            
-            # Count threat levels
-            level = event.get("threat_level", "unknown")
-            threat_levels[level] = threat_levels.get(level, 0) + 1
-            
-            # Count scenarios
-            scenario = event.get("scenario_name", "unknown")
-            scenarios[scenario] = scenarios.get(scenario, 0) + 1
-        
+
         return {
-            "total_events": len(events),
-            "event_types": event_types,
-            "threat_levels": threat_levels,
-            "scenarios": scenarios,
-            "latest_event": events[-1] if events else None
+            "total_events": total,
+            "event_types": dict(event_types),
+            "threat_levels": dict(threat_levels),
+            "scenarios": dict(scenarios),
+            "latest_event": latest
         }
-    
+
     def cleanup_old_events(self, days_old=30):
         """Cleanup events older than specified days (placeholder)"""
         # Implementation would filter by timestamp
         # For now, just return current count
-        events = self.get_all_events()
-        return {"message": f"Would cleanup events older than {days_old} days", "current_count": len(events)}
+        count = sum(1 for _ in self._iter_events())
+        return {"message": f"Would cleanup events older than {days_old} days", "current_count": count}
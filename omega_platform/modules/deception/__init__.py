@@ -6,7 +6,7 @@ Now with working legacy integration
 
 import logging
 from omega_platform.modules import BaseModule
-from typing import Dict, Any
+from typing import Dict, Any, List
 
 logger = logging.getLogger(__name__)
 
@@ -16,16 +16,17 @@ class DeceptionModule(BaseModule):
     def __init__(self, config: Dict[str, Any], engine):
         super().__init__(config, engine)
         self.honeypots = []
+        self._honeypots_by_id = {}
         self.traps = []
         self.adapter = None
-        
+
         # Initialize working adapter
         try:
             from .working_adapter import WorkingDeceptionAdapter
             self.adapter = WorkingDeceptionAdapter(config, engine)
             logger.info("Working deception adapter initialized")
         except Exception as e:
-            logger.error(f"Failed to initialize working adapter: {e}")
+            logger.error("Failed to initialize working adapter: %s", e)
             self.adapter = None
         
     def start(self):
@@ -37,9 +38,10 @@ class DeceptionModule(BaseModule):
             try:
                 self.adapter.start()
                 self.honeypots = self.adapter.get_honeypots()
-                logger.info(f"Adapter started with {len(self.honeypots)} honeypots")
+                self._rebuild_index()
+                logger.info("Adapter started with %d honeypots", len(self.honeypots))
             except Exception as e:
-                logger.error(f"Failed to start adapter: {e}")
+                logger.error("Failed to start adapter: %s", e)
                 self._create_default_honeypots()
         else:
             self._create_default_honeypots()
@@ -67,23 +69,28 @@ class DeceptionModule(BaseModule):
             },
         ]
         
-        # Merge with config
+        # Merge with config, deduplicating by name via a set probe instead
+        # of an O(D*C) list-membership scan over unhashable dicts
+        default_names = {c['name'] for c in default_configs}
         config_honeypots = self.config.get('honeypots', [])
-        all_configs = default_configs + [c for c in config_honeypots 
-                                        if c not in default_configs]
-        
-        self.honeypots = []
-        for hp_config in all_configs:
-            self.honeypots.append({
-                'id': hp_config.get('name', 'unknown').lower().replace(' ', '_'),
-                'name': hp_config.get('name', 'Unnamed Honeypot'),
-                'type': hp_config.get('type', 'unknown'),
-                'port': hp_config.get('port', 0),
-                'running': True,
-                'config': hp_config,
-            })
-        
-        logger.info(f"Created {len(self.honeypots)} default honeypots")
+        all_configs = default_configs + [c for c in config_honeypots
+                                        if c.get('name') not in default_names]
+
+        self.honeypots = [{
+            'id': hp_config.get('name', 'unknown').lower().replace(' ', '_'),
+            'name': hp_config.get('name', 'Unnamed Honeypot'),
+            'type': hp_config.get('type', 'unknown'),
+            'port': hp_config.get('port', 0),
+            'running': True,
+            'config': hp_config,
+        } for hp_config in all_configs]
+
+        self._rebuild_index()
+        logger.info("Created %d default honeypots", len(self.honeypots))
+
+    def _rebuild_index(self):
+        """Rebuild the id->honeypot index after self.honeypots changes"""
+        self._honeypots_by_id = {hp['id']: hp for hp in self.honeypots}
     
     def stop(self):
         """Stop the deception module"""
@@ -94,7 +101,7 @@ class DeceptionModule(BaseModule):
             try:
                 self.adapter.stop()
             except Exception as e:
-                logger.error(f"Error stopping adapter: {e}")
+                logger.error("Error stopping adapter: %s", e)
         
         self.running = False
         logger.info("Deception Module stopped")
@@ -124,11 +131,11 @@ class DeceptionModule(BaseModule):
     
     def log_interaction(self, honeypot_id: str, interaction_data: Dict[str, Any]):
         """Log an interaction with a honeypot"""
-        logger.info(f"Honeypot interaction: {honeypot_id} - {interaction_data}")
+        logger.info("Honeypot interaction: %s - %s", honeypot_id, interaction_data)
         
         # Forward to adapter if available
         if self.adapter and hasattr(self.adapter, '_log_attack'):
-            honeypot = next((hp for hp in self.honeypots if hp['id'] == honeypot_id), None)
+            honeypot = self._honeypots_by_id.get(honeypot_id)
             if honeypot:
                 self.adapter._log_attack(honeypot, 
                                        interaction_data.get('attack_type', 'unknown'),
@@ -163,6 +170,3 @@ class DeceptionModule(BaseModule):
             base_status['adapter_details'] = adapter_status
         
         return base_status
-
-# Need List type hint
-from typing import List
@@ -10,6 +10,11 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# Loaded legacy modules keyed by (path, mtime) so restarts skip the
+# directory scan and exec_module cost; a changed file invalidates the entry
+_LEGACY_CACHE = {}
+_LISTDIR_CACHE = {}
+
 class LegacyDeceptionAdapter(BaseModule):
     """Adapter to integrate legacy deception engine with new module system"""
     
@@ -26,38 +31,51 @@ class LegacyDeceptionAdapter(BaseModule):
             legacy_path = os.path.join(os.path.dirname(__file__), 'legacy')
             
             # Look for Python files in the legacy directory
-            python_files = [f for f in os.listdir(legacy_path) 
-                           if f.endswith('.py') and not f.startswith('__')]
-            
+            # (cached per directory mtime so restarts skip the scan)
+            dir_key = (legacy_path, os.stat(legacy_path).st_mtime)
+            python_files = _LISTDIR_CACHE.get(dir_key)
+            if python_files is None:
+                python_files = [f for f in os.listdir(legacy_path)
+                               if f.endswith('.py') and not f.startswith('__')]
+                _LISTDIR_CACHE[dir_key] = python_files
+
             if python_files:
-                logger.info(f"Found legacy Python files: {python_files}")
-                
+                logger.info("Found legacy Python files: %s", python_files)
+
                 # Try to load the first Python file as a module
                 first_module = python_files[0].replace('.py', '')
                 module_path = os.path.join(legacy_path, python_files[0])
-                
-                # Load module dynamically
-                spec = importlib.util.spec_from_file_location(first_module, module_path)
-                if spec and spec.loader:
-                    module = importlib.util.module_from_spec(spec)
-                    spec.loader.exec_module(module)
+
+                # Reuse an already-loaded module if the file hasn't changed
+                key = (module_path, os.stat(module_path).st_mtime)
+                module = _LEGACY_CACHE.get(key)
+                if module is not None:
                     self.legacy_engine = module
-                    logger.info(f"Loaded legacy module: {first_module}")
+                    logger.info("Reusing cached legacy module: %s", first_module)
                 else:
-                    logger.warning("Could not load legacy module")
+                    # Load module dynamically
+                    spec = importlib.util.spec_from_file_location(first_module, module_path)
+                    if spec and spec.loader:
+                        module = importlib.util.module_from_spec(spec)
+                        spec.loader.exec_module(module)
+                        _LEGACY_CACHE[key] = module
+                        self.legacy_engine = module
+                        logger.info("Loaded legacy module: %s", first_module)
+                    else:
+                        logger.warning("Could not load legacy module")
             else:
                 logger.warning("No Python files found in legacy directory")
             
             # Initialize with config
             port = self.config.get('port', 8080)
-            logger.info(f"Legacy deception engine adapter configured for port {port}")
+            logger.info("Legacy deception engine adapter configured for port %s", port)
             
             # Mark as running
             self.running = True
             logger.info("Legacy deception engine adapter started")
             
         except Exception as e:
-            logger.error(f"Failed to initialize legacy deception engine: {e}")
+            logger.error("Failed to initialize legacy deception engine: %s", e)
             # Don't raise - we want to continue even if legacy fails
             self.running = True  # Still mark as running for new features
     
@@ -7,68 +7,171 @@ This bridges the new module system with the legacy deception engine
 import sys
 import os
 import importlib.util
+import itertools
 import logging
+import random
+import time
+from collections import deque
+from dataclasses import dataclass
 from typing import Dict, Any, List, Optional
-from datetime import datetime
 
 logger = logging.getLogger(__name__)
 
+# Wallclock second formatted at most once per second; only the
+# microsecond suffix is recomputed per timestamp
+_ts_cache = (0, '')
+
+def _iso_ts() -> str:
+    """ISO-8601 UTC timestamp, cheap enough for hot log paths"""
+    global _ts_cache
+    now = time.time_ns()
+    sec = now // 1_000_000_000
+    if _ts_cache[0] != sec:
+        _ts_cache = (sec, time.strftime('%Y-%m-%dT%H:%M:%S', time.gmtime(sec)))
+    return f"{_ts_cache[1]}.{(now % 1_000_000_000) // 1000:06d}"
+
+_SLUG_TRANS = str.maketrans({' ': '_'})
+
+def _slug(name: str) -> str:
+    """Honeypot id from a display name; interned since ids key dicts"""
+    return sys.intern(name.lower().translate(_SLUG_TRANS))
+
+# Static fallback honeypots, built once at import; _create_mock_honeypots
+# shallow-copies each entry before handing it out for mutation
+_DEFAULT_HONEYPOTS = (
+    {
+        'id': 'ssh_honeypot',
+        'name': 'SSH Honeypot',
+        'type': 'ssh',
+        'port': 2222,
+        'running': True,
+        'config': {'banner': 'SSH-2.0-OpenSSH_7.9p1'},
+    },
+    {
+        'id': 'http_honeypot',
+        'name': 'Web Honeypot',
+        'type': 'http',
+        'port': 8081,
+        'running': True,
+        'config': {'template': 'default_website'},
+    },
+    {
+        'id': 'mysql_honeypot',
+        'name': 'MySQL Honeypot',
+        'type': 'mysql',
+        'port': 3306,
+        'running': True,
+        'config': {'version': '5.7.0'},
+    },
+)
+
+@dataclass(slots=True)
+class AttackLog:
+    """One attack log entry; slotted since these accumulate by the thousand"""
+    timestamp: str
+    honeypot_id: str
+    honeypot_name: str
+    attack_type: str
+    result: Dict[str, Any]
+    detected: bool = True  # Honeypots always detect attacks
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'timestamp': self.timestamp,
+            'honeypot_id': self.honeypot_id,
+            'honeypot_name': self.honeypot_name,
+            'attack_type': self.attack_type,
+            'result': self.result,
+            'detected': self.detected,
+        }
+
 class WorkingDeceptionAdapter:
     """Adapter that actually works with the deception engine"""
-    
+
+    __slots__ = ('config', 'engine', 'honeypots', '_honeypot_index',
+                 'attack_logs', '_sim_delay', 'running', 'legacy_module',
+                 '_legacy_loaded')
+
+    # Loaded legacy module shared across adapter instances so repeated
+    # construction doesn't re-exec deception_api
+    _legacy_module_cache = None
+
     def __init__(self, config: Dict[str, Any], engine=None):
         self.config = config
         self.engine = engine
         self.honeypots = []
+        self._honeypot_index = {}
+        # Bounded so a long-running adapter can't grow the log without limit
+        self.attack_logs = deque(maxlen=config.get('attack_log_capacity', 10000))
+        # Artificial per-attack latency; production and CI leave this at 0
+        self._sim_delay = config.get('simulation_delay', 0.0)
         self.running = False
         self.legacy_module = None
-        self._load_legacy_engine()
+        # Loading the legacy engine spec-loads a module and hits the
+        # filesystem, so it's deferred until start()/attack time
+        self._legacy_loaded = False
+
+    def _ensure_legacy(self):
+        """Load the legacy engine on first use"""
+        if not self._legacy_loaded:
+            self._load_legacy_engine()
+            self._legacy_loaded = True
+
+    def _rebuild_index(self):
+        """Rebuild the id->honeypot index after self.honeypots changes"""
+        self._honeypot_index = {hp['id']: hp for hp in self.honeypots}
     
     def _load_legacy_engine(self):
         """Load the legacy deception engine"""
         try:
+            # Reuse the module loaded by a previous adapter instance
+            if WorkingDeceptionAdapter._legacy_module_cache is not None:
+                self.legacy_module = WorkingDeceptionAdapter._legacy_module_cache
+                if hasattr(self.legacy_module, 'initialize'):
+                    self.legacy_module.initialize(self.config)
+                return
+
             legacy_path = os.path.join(os.path.dirname(__file__), 'legacy')
-            
+
             # Add to Python path
             if legacy_path not in sys.path:
                 sys.path.insert(0, legacy_path)
-            
-            # Check what's available
-            python_files = []
-            for root, dirs, files in os.walk(legacy_path):
-                for file in files:
-                    if file.endswith('.py') and not file.startswith('__'):
-                        python_files.append(os.path.join(root, file))
-            
-            logger.info(f"Found {len(python_files)} Python files in legacy deception")
-            
-            if python_files:
-                # Try to import the main deception module
+
+            # Probe the one file we actually load instead of walking the
+            # whole legacy subtree; a diagnostic listing is debug-only
+            api_path = os.path.join(legacy_path, 'deception_api.py')
+            if logger.isEnabledFor(logging.DEBUG):
+                try:
+                    with os.scandir(legacy_path) as entries:
+                        count = sum(1 for e in entries
+                                    if e.name.endswith('.py') and not e.name.startswith('__'))
+                    logger.debug("Found %d Python files in legacy deception", count)
+                except OSError:
+                    pass
+
+            if os.path.isfile(api_path):
                 try:
-                    # First, check for deception_api
-                    api_path = os.path.join(legacy_path, 'deception_api.py')
-                    if os.path.exists(api_path):
-                        spec = importlib.util.spec_from_file_location("deception_api", api_path)
-                        if spec and spec.loader:
-                            self.legacy_module = importlib.util.module_from_spec(spec)
-                            spec.loader.exec_module(self.legacy_module)
-                            logger.info("Loaded deception_api module")
-                            
-                            # Initialize if there's an init function
-                            if hasattr(self.legacy_module, 'initialize'):
-                                self.legacy_module.initialize(self.config)
-                                logger.info("Initialized deception engine")
-                    else:
-                        logger.warning("deception_api.py not found in legacy directory")
-                        
+                    spec = importlib.util.spec_from_file_location("deception_api", api_path)
+                    if spec and spec.loader:
+                        self.legacy_module = importlib.util.module_from_spec(spec)
+                        spec.loader.exec_module(self.legacy_module)
+                        logger.info("Loaded deception_api module")
+                        WorkingDeceptionAdapter._legacy_module_cache = self.legacy_module
+
+                        # Initialize if there's an init function
+                        if hasattr(self.legacy_module, 'initialize'):
+                            self.legacy_module.initialize(self.config)
+                            logger.info("Initialized deception engine")
                 except Exception as e:
                     logger.error(f"Failed to load deception_api: {e}")
-            
+            else:
+                logger.warning("deception_api.py not found in legacy directory")
+
             # If no module loaded, create a mock for development
             if not self.legacy_module:
                 logger.warning("Creating mock deception engine for development")
                 self.legacy_module = self._create_mock_engine()
-                
+
         except Exception as e:
             logger.error(f"Failed to load legacy deception engine: {e}")
             self.legacy_module = self._create_mock_engine()
@@ -76,24 +179,31 @@ class WorkingDeceptionAdapter:
     def _create_mock_engine(self):
         """Create a mock deception engine for development"""
         class MockDeceptionEngine:
+            __slots__ = ('honeypots', 'honeypot_index', 'logs', 'config',
+                         '_sim_delay')
+
             def __init__(self):
                 self.honeypots = []
+                self.honeypot_index = {}
                 self.logs = []
                 self.config = {}
-            
+                self._sim_delay = 0.0
+
             def initialize(self, config):
                 self.config = config
+                self._sim_delay = config.get('simulation_delay', 0.0)
                 # Create mock honeypots based on config
                 honeypot_configs = config.get('honeypots', [])
                 for hp_config in honeypot_configs:
                     self.honeypots.append({
-                        'id': hp_config.get('name', 'unknown').lower().replace(' ', '_'),
+                        'id': _slug(hp_config.get('name', 'unknown')),
                         'name': hp_config.get('name', 'Unnamed Honeypot'),
                         'type': hp_config.get('type', 'unknown'),
                         'port': hp_config.get('port', 0),
                         'running': True,
                         'config': hp_config,
                     })
+                self.honeypot_index = {hp['id']: hp for hp in self.honeypots}
                 return True
             
             def get_honeypots(self):
@@ -101,7 +211,7 @@ class WorkingDeceptionAdapter:
             
             def log_interaction(self, honeypot_id, interaction_data):
                 log_entry = {
-                    'timestamp': datetime.utcnow().isoformat(),
+                    'timestamp': _iso_ts(),
                     'honeypot_id': honeypot_id,
                     'data': interaction_data,
                     'detected': True,  # Mock detection
@@ -111,22 +221,20 @@ class WorkingDeceptionAdapter:
             
             def simulate_attack(self, honeypot_id, attack_type, params):
                 """Simulate an attack against a honeypot"""
-                honeypot = next((hp for hp in self.honeypots if hp['id'] == honeypot_id), None)
+                honeypot = self.honeypot_index.get(honeypot_id)
                 if not honeypot:
                     return {'success': False, 'error': 'Honeypot not found'}
                 
                 # Simulate different attack types
-                import random
-                import time
-                
-                time.sleep(0.5)  # Simulate processing time
+                if self._sim_delay:
+                    time.sleep(self._sim_delay)  # Simulate processing time
                 
                 result = {
                     'success': random.random() > 0.3,  # 70% success rate
                     'honeypot_id': honeypot_id,
                     'honeypot_name': honeypot['name'],
                     'attack_type': attack_type,
-                    'timestamp': datetime.utcnow().isoformat(),
+                    'timestamp': _iso_ts(),
                 }
                 
                 # Type-specific results
@@ -154,7 +262,8 @@ class WorkingDeceptionAdapter:
     def start(self):
         """Start the deception adapter"""
         logger.info("Starting Working Deception Adapter...")
-        
+        self._ensure_legacy()
+
         if self.legacy_module:
             try:
                 # Initialize if not already
@@ -171,7 +280,7 @@ class WorkingDeceptionAdapter:
                     self.honeypots = []
                     for hp_config in honeypot_configs:
                         self.honeypots.append({
-                            'id': hp_config.get('name', 'unknown').lower().replace(' ', '_'),
+                            'id': _slug(hp_config.get('name', 'unknown')),
                             'name': hp_config.get('name', 'Unnamed Honeypot'),
                             'type': hp_config.get('type', 'unknown'),
                             'port': hp_config.get('port', 0),
@@ -184,45 +293,25 @@ class WorkingDeceptionAdapter:
                 logger.error(f"Failed to initialize deception engine: {e}")
                 # Create mock honeypots
                 self._create_mock_honeypots()
-        
+
+        self._rebuild_index()
         self.running = True
         logger.info("Working Deception Adapter started")
         return True
     
     def _create_mock_honeypots(self):
         """Create mock honeypots if real ones fail"""
-        default_honeypots = [
-            {
-                'id': 'ssh_honeypot',
-                'name': 'SSH Honeypot',
-                'type': 'ssh',
-                'port': 2222,
-                'running': True,
-                'config': {'banner': 'SSH-2.0-OpenSSH_7.9p1'},
-            },
-            {
-                'id': 'http_honeypot',
-                'name': 'Web Honeypot',
-                'type': 'http',
-                'port': 8081,
-                'running': True,
-                'config': {'template': 'default_website'},
-            },
-            {
-                'id': 'mysql_honeypot',
-                'name': 'MySQL Honeypot',
-                'type': 'mysql',
-                'port': 3306,
-                'running': True,
-                'config': {'version': '5.7.0'},
-            },
-        ]
-        
-        # Merge with config
+        default_honeypots = [dict(hp) for hp in _DEFAULT_HONEYPOTS]
+
+
+        # Merge with config, probing a set of known ids instead of
+        # rescanning the defaults list per entry
+        existing_ids = {hp['id'] for hp in default_honeypots}
         config_honeypots = self.config.get('honeypots', [])
         for hp_config in config_honeypots:
-            hp_id = hp_config.get('name', 'unknown').lower().replace(' ', '_')
-            if not any(hp['id'] == hp_id for hp in default_honeypots):
+            hp_id = _slug(hp_config.get('name', 'unknown'))
+            if hp_id not in existing_ids:
+                existing_ids.add(hp_id)
                 default_honeypots.append({
                     'id': hp_id,
                     'name': hp_config.get('name', 'Unnamed Honeypot'),
@@ -233,7 +322,8 @@ class WorkingDeceptionAdapter:
                 })
         
         self.honeypots = default_honeypots
-    
+        self._rebuild_index()
+
     def stop(self):
         """Stop the deception adapter"""
         logger.info("Stopping Working Deception Adapter...")
@@ -249,11 +339,12 @@ class WorkingDeceptionAdapter:
         """Execute an attack against a honeypot"""
         if not self.running:
             return {'success': False, 'error': 'Adapter not running'}
-        
+
+        self._ensure_legacy()
         parameters = parameters or {}
         
         # Find the honeypot
-        honeypot = next((hp for hp in self.honeypots if hp['id'] == honeypot_id), None)
+        honeypot = self._honeypot_index.get(honeypot_id)
         if not honeypot:
             return {'success': False, 'error': f'Honeypot not found: {honeypot_id}'}
         
@@ -281,17 +372,15 @@ class WorkingDeceptionAdapter:
     def _simulate_attack(self, honeypot: Dict[str, Any], attack_type: str,
                         parameters: Dict[str, Any]) -> Dict[str, Any]:
         """Simulate an attack (used if legacy engine doesn't have the method)"""
-        import random
-        import time
-        
-        time.sleep(0.3)  # Simulate processing
+        if self._sim_delay:
+            time.sleep(self._sim_delay)  # Simulate processing
         
         result = {
             'success': random.random() > 0.3,  # 70% success rate
             'honeypot_id': honeypot['id'],
             'honeypot_name': honeypot['name'],
             'attack_type': attack_type,
-            'timestamp': datetime.utcnow().isoformat(),
+            'timestamp': _iso_ts(),
             'parameters': parameters,
         }
         
@@ -338,20 +427,17 @@ class WorkingDeceptionAdapter:
     def _log_attack(self, honeypot: Dict[str, Any], attack_type: str,
                    result: Dict[str, Any]):
         """Log the attack"""
-        log_entry = {
-            'timestamp': datetime.utcnow().isoformat(),
-            'honeypot_id': honeypot['id'],
-            'honeypot_name': honeypot['name'],
-            'attack_type': attack_type,
-            'result': result,
-            'detected': True,  # Honeypots always detect attacks
-        }
-        
-        # Store in module logs
-        if not hasattr(self, 'attack_logs'):
-            self.attack_logs = []
+        log_entry = AttackLog(
+            timestamp=_iso_ts(),
+            honeypot_id=honeypot['id'],
+            honeypot_name=honeypot['name'],
+            attack_type=attack_type,
+            result=result,
+        )
+
+        # Store in module logs (deque evicts the oldest automatically)
         self.attack_logs.append(log_entry)
-        
+
         logger.info(f"Attack logged: {attack_type} on {honeypot['name']} - "
                    f"Success: {result.get('success', False)}")
     
@@ -364,22 +450,22 @@ class WorkingDeceptionAdapter:
                     'honeypot': honeypot,
                     'attack_type': attack_type,
                     'result': result,
-                    'timestamp': datetime.utcnow().isoformat(),
+                    'timestamp': _iso_ts(),
                 })
             except Exception as e:
                 logger.error(f"Failed to notify engine: {e}")
     
     def get_attack_logs(self, limit: int = 50) -> List[Dict[str, Any]]:
         """Get recent attack logs"""
-        if hasattr(self, 'attack_logs'):
-            return self.attack_logs[-limit:] if self.attack_logs else []
-        return []
-    
+        start = max(0, len(self.attack_logs) - limit)
+        return [entry.to_dict()
+                for entry in itertools.islice(self.attack_logs, start, None)]
+
     def status(self) -> Dict[str, Any]:
         """Get adapter status"""
         return {
             'running': self.running,
             'honeypots_count': len(self.honeypots),
             'legacy_engine_loaded': self.legacy_module is not None,
-            'attack_logs_count': len(getattr(self, 'attack_logs', [])),
+            'attack_logs_count': len(self.attack_logs),
         }
@@ -3,72 +3,110 @@ Scenario Marketplace for Omega Platform
 """
 import json
 import os
+from collections import Counter
 from datetime import datetime
+from pathlib import Path
+
+from omega_platform.modules import ensure_dir
+
+try:
+    import orjson
+except ImportError:  # optional native-speed encoder
+    orjson = None
+
+if orjson is not None:
+    def _dumps_pretty(obj):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    _loads = orjson.loads
+else:
+    def _dumps_pretty(obj):
+        return json.dumps(obj, indent=2).encode()
+    _loads = json.loads
+
+# Seed scenarios written when no marketplace file exists yet; static,
+# so built once at import instead of per instantiation
+_SAMPLE_SCENARIOS = (
+    {
+        "id": "market_001",
+        "name": "Advanced Spear Phishing",
+        "description": "Advanced phishing with attachment and tracking",
+        "author": "Security Team",
+        "difficulty": "medium",
+        "mitre_techniques": ["T1566", "T1566.001"],
+        "downloads": 42,
+        "rating": 4.5,
+        "category": "phishing"
+    },
+    {
+        "id": "market_002",
+        "name": "Ransomware Impact Simulation",
+        "description": "Simulate ransomware encryption and impact",
+        "author": "Red Team",
+        "difficulty": "hard",
+        "mitre_techniques": ["T1486", "T1490"],
+        "downloads": 28,
+        "rating": 4.2,
+        "category": "ransomware"
+    },
+    {
+        "id": "market_003",
+        "name": "Web Application Exploit",
+        "description": "Simulate web app vulnerability exploitation",
+        "author": "PenTest Team",
+        "difficulty": "medium",
+        "mitre_techniques": ["T1190", "T1210"],
+        "downloads": 35,
+        "rating": 4.0,
+        "category": "web"
+    }
+)
 
 class ScenarioMarketplace:
     def __init__(self):
         self.marketplace_dir = "omega_platform/data/marketplace"
-        os.makedirs(self.marketplace_dir, exist_ok=True)
-        
+        self.marketplace_file = f"{self.marketplace_dir}/marketplace_scenarios.json"
+        ensure_dir(self.marketplace_dir)
+
+        # Parsed marketplace cache, invalidated when the file's mtime changes
+        self._cache = None
+        self._cache_mtime = -1
+
         # Initialize with sample marketplace scenarios
         self._initialize_marketplace()
     
     def _initialize_marketplace(self):
         """Create sample marketplace scenarios if none exist"""
-        sample_file = f"{self.marketplace_dir}/marketplace_scenarios.json"
-        
+        sample_file = self.marketplace_file
+
         if not os.path.exists(sample_file):
-            sample_scenarios = [
-                {
-                    "id": "market_001",
-                    "name": "Advanced Spear Phishing",
-                    "description": "Advanced phishing with attachment and tracking",
-                    "author": "Security Team",
-                    "difficulty": "medium",
-                    "mitre_techniques": ["T1566", "T1566.001"],
-                    "downloads": 42,
-                    "rating": 4.5,
-                    "category": "phishing"
-                },
-                {
-                    "id": "market_002", 
-                    "name": "Ransomware Impact Simulation",
-                    "description": "Simulate ransomware encryption and impact",
-                    "author": "Red Team",
-                    "difficulty": "hard",
-                    "mitre_techniques": ["T1486", "T1490"],
-                    "downloads": 28,
-                    "rating": 4.2,
-                    "category": "ransomware"
-                },
-                {
-                    "id": "market_003",
-                    "name": "Web Application Exploit",
-                    "description": "Simulate web app vulnerability exploitation",
-                    "author": "PenTest Team",
-                    "difficulty": "medium",
-                    "mitre_techniques": ["T1190", "T1210"],
-                    "downloads": 35,
-                    "rating": 4.0,
-                    "category": "web"
-                }
-            ]
-            
-            with open(sample_file, 'w') as f:
-                json.dump(sample_scenarios, f, indent=2)
+            self._atomic_write(sample_file, list(_SAMPLE_SCENARIOS))
+
+    @staticmethod
+    def _atomic_write(path, obj):
+        """Write JSON via a same-directory tempfile so a crash mid-write
+        can't truncate the target"""
+        tmp = f"{path}.tmp"
+        Path(tmp).write_bytes(_dumps_pretty(obj))
+        os.replace(tmp, path)
     
     def get_marketplace_scenarios(self):
-        """Get all marketplace scenarios"""
-        marketplace_file = f"{self.marketplace_dir}/marketplace_scenarios.json"
-        
-        if not os.path.exists(marketplace_file):
+        """Get all marketplace scenarios (cached until the file changes)"""
+        try:
+            mtime = os.stat(self.marketplace_file).st_mtime_ns
+        except OSError:
             return []
-        
-        with open(marketplace_file, 'r') as f:
-            try:
-                return json.load(f)
-            except json.JSONDecodeError:
-                return []
+
+        if mtime == self._cache_mtime and self._cache is not None:
+            return self._cache
+
+        try:
+            scenarios = _loads(Path(self.marketplace_file).read_bytes())
+        except ValueError:
+            return []
+
+        self._cache = scenarios
+        self._cache_mtime = mtime
+        return scenarios
     
     def import_scenario(self, scenario_id):
         """Import a scenario from marketplace to user library"""
@@ -80,7 +118,7 @@ class ScenarioMarketplace:
         
         # Create user scenarios directory
         user_dir = "omega_platform/data/scenarios/user"
-        os.makedirs(user_dir, exist_ok=True)
+        ensure_dir(user_dir)
         
         # Save to user library
         user_scenario = scenario.copy()
@@ -88,54 +126,41 @@ class ScenarioMarketplace:
         user_scenario["source"] = "marketplace"
         
         user_file = f"{user_dir}/{scenario_id}.json"
-        with open(user_file, 'w') as f:
-            json.dump(user_scenario, f, indent=2)
-        
-        # Update download count
-        self._increment_download_count(scenario_id)
-        
+        self._atomic_write(user_file, user_scenario)
+
+        # Bump the download count on the cached list and persist the
+        # marketplace once, atomically
+        scenario["downloads"] = scenario.get("downloads", 0) + 1
+        self._atomic_write(self.marketplace_file, marketplace)
+        self._cache = marketplace
+        self._cache_mtime = os.stat(self.marketplace_file).st_mtime_ns
+
         return {
             "success": True,
             "message": f"Scenario '{scenario['name']}' imported successfully",
             "scenario": user_scenario
         }
     
-    def _increment_download_count(self, scenario_id):
-        """Increment download count for a scenario"""
-        marketplace_file = f"{self.marketplace_dir}/marketplace_scenarios.json"
-        
-        if not os.path.exists(marketplace_file):
-            return
-        
-        with open(marketplace_file, 'r') as f:
-            scenarios = json.load(f)
-        
-        for scenario in scenarios:
-            if scenario["id"] == scenario_id:
-                scenario["downloads"] = scenario.get("downloads", 0) + 1
-                break
-        
-        with open(marketplace_file, 'w') as f:
-            json.dump(scenarios, f, indent=2)
-    
     def get_stats(self):
         """Get marketplace statistics"""
         scenarios = self.get_marketplace_scenarios()
         
         if not scenarios:
             return {"total": 0}
-        
-        categories = {}
+
+        # Single pass: counts, downloads and rating sum together
+        categories = Counter()
         total_downloads = 0
-        
+        total_rating = 0.0
+
         for scenario in scenarios:
-            category = scenario.get("category", "uncategorized")
-            categories[category] = categories.get(category, 0) + 1
+            categories[scenario.get("category", "uncategorized")] += 1
             total_downloads += scenario.get("downloads", 0)
-        
+            total_rating += scenario.get("rating", 0)
+
         return {
             "total_scenarios": len(scenarios),
             "total_downloads": total_downloads,
-            "categories": categories,
-            "average_rating": sum(s.get("rating", 0) for s in scenarios) / len(scenarios) if scenarios else 0
+            "categories": dict(categories),
+            "average_rating": total_rating / len(scenarios)
         }
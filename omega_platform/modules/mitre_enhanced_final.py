@@ -3,91 +3,133 @@ Enhanced MITRE Module with all techniques from scenarios
 """
 import json
 from pathlib import Path
+from types import MappingProxyType
+
+from omega_platform.modules import ensure_dir
+
+try:
+    import orjson
+except ImportError:  # optional native-speed encoder
+    orjson = None
+
+if orjson is not None:
+    def _dumps_pretty(obj):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+else:
+    def _dumps_pretty(obj):
+        return json.dumps(obj, indent=2).encode()
+
+# Shared technique table with all known mappings: built once at import,
+# read-only so every instance can reference it without copying
+_TECHNIQUES = MappingProxyType({
+    "T1566": {
+        "id": "T1566",
+        "name": "Phishing",
+        "description": "Adversaries send phishing messages to gain access",
+        "tactics": ["Initial Access"],
+        "mitigation": "User training, email filtering"
+    },
+    "T1486": {
+        "id": "T1486",
+        "name": "Data Encrypted for Impact",
+        "description": "Adversaries encrypt data to disrupt availability",
+        "tactics": ["Impact"],
+        "mitigation": "Regular backups"
+    },
+    "T1190": {
+        "id": "T1190",
+        "name": "Exploit Public-Facing Application",
+        "description": "Adversaries exploit vulnerabilities in internet-facing systems",
+        "tactics": ["Initial Access"],
+        "mitigation": "Patching, WAF"
+    },
+    "T1059": {
+        "id": "T1059",
+        "name": "Command and Scripting Interpreter",
+        "description": "Adversaries abuse command and scripting interpreters",
+        "tactics": ["Execution"],
+        "mitigation": "Restrict scripting, application whitelisting"
+    },
+    "T1210": {
+        "id": "T1210",
+        "name": "Exploitation of Remote Services",
+        "description": "Adversaries exploit remote services to gain access",
+        "tactics": ["Lateral Movement"],
+        "mitigation": "Network segmentation, patching"
+    },
+    "T1490": {
+        "id": "T1490",
+        "name": "Inhibit System Recovery",
+        "description": "Adversaries delete backups to prevent recovery",
+        "tactics": ["Impact"],
+        "mitigation": "Offsite backups, immutable storage"
+    },
+    "T1566.001": {
+        "id": "T1566.001",
+        "name": "Spearphishing Attachment",
+        "description": "Spearphishing with malicious attachments",
+        "tactics": ["Initial Access"],
+        "mitigation": "Attachment filtering, sandboxing"
+    }
+})
+
+# Reverse tactic->techniques index and tactic set, derived from the shared
+# table so get_stats and get_techniques_by_tactic don't rescan per call
+_BY_TACTIC = {}
+_ALL_TACTICS = set()
+for _tech in _TECHNIQUES.values():
+    for _tactic in _tech.get('tactics', []):
+        _BY_TACTIC.setdefault(_tactic, []).append(_tech)
+        _ALL_TACTICS.add(_tactic)
+del _tech, _tactic
+
+# Shared miss value for tactic lookups; avoids a list allocation per call
+_EMPTY_TUPLE = ()
 
 class MITREModuleEnhanced:
     def __init__(self):
         self.data_dir = Path("omega_platform/data/mitre_attack")
-        self.data_dir.mkdir(parents=True, exist_ok=True)
-        self.techniques = self._load_techniques()
-    
-    def _load_techniques(self):
-        """Load techniques with all known mappings"""
-        techniques = {
-            "T1566": {
-                "id": "T1566",
-                "name": "Phishing",
-                "description": "Adversaries send phishing messages to gain access",
-                "tactics": ["Initial Access"],
-                "mitigation": "User training, email filtering"
-            },
-            "T1486": {
-                "id": "T1486",
-                "name": "Data Encrypted for Impact",
-                "description": "Adversaries encrypt data to disrupt availability",
-                "tactics": ["Impact"],
-                "mitigation": "Regular backups"
-            },
-            "T1190": {
-                "id": "T1190",
-                "name": "Exploit Public-Facing Application",
-                "description": "Adversaries exploit vulnerabilities in internet-facing systems",
-                "tactics": ["Initial Access"],
-                "mitigation": "Patching, WAF"
-            },
-            "T1059": {
-                "id": "T1059",
-                "name": "Command and Scripting Interpreter",
-                "description": "Adversaries abuse command and scripting interpreters",
-                "tactics": ["Execution"],
-                "mitigation": "Restrict scripting, application whitelisting"
-            },
-            "T1210": {
-                "id": "T1210",
-                "name": "Exploitation of Remote Services",
-                "description": "Adversaries exploit remote services to gain access",
-                "tactics": ["Lateral Movement"],
-                "mitigation": "Network segmentation, patching"
-            },
-            "T1490": {
-                "id": "T1490",
-                "name": "Inhibit System Recovery",
-                "description": "Adversaries delete backups to prevent recovery",
-                "tactics": ["Impact"],
-                "mitigation": "Offsite backups, immutable storage"
-            },
-            "T1566.001": {
-                "id": "T1566.001",
-                "name": "Spearphishing Attachment",
-                "description": "Spearphishing with malicious attachments",
-                "tactics": ["Initial Access"],
-                "mitigation": "Attachment filtering, sandboxing"
-            }
-        }
-        
-        # Save to file
+        ensure_dir(self.data_dir)
+        self.techniques = _TECHNIQUES
+        self._by_tactic = _BY_TACTIC
+        self._all_tactics = _ALL_TACTICS
+        self._save_techniques()
+
+    def _save_techniques(self):
+        """Persist the technique table, but only when missing or stale —
+        this runs on every construction and the table never changes at
+        runtime"""
         techniques_file = self.data_dir / "techniques_enhanced.json"
-        with open(techniques_file, 'w') as f:
-            json.dump(techniques, f, indent=2)
-        
-        return techniques
-    
+        payload = _dumps_pretty(dict(self.techniques))
+        try:
+            if techniques_file.read_bytes() == payload:
+                return
+        except OSError:
+            pass
+        techniques_file.write_bytes(payload)
+
     def get_technique(self, tech_id):
-        return self.techniques.get(tech_id, {
+        # Build the placeholder only on a miss; .get with a literal default
+        # would allocate it on every call
+        tech = self.techniques.get(tech_id)
+        if tech is not None:
+            return tech
+        return {
             "id": tech_id,
             "name": f"Technique {tech_id}",
             "tactics": ["Unknown"],
             "description": "No description available"
-        })
-    
+        }
+
     def get_all(self):
         return list(self.techniques.values())
-    
+
     def get_stats(self):
         return {
             "total_techniques": len(self.techniques),
-            "tactics_covered": len(set().union(*[t.get('tactics', []) for t in self.techniques.values()])),
+            "tactics_covered": len(self._all_tactics),
             "technique_ids": list(self.techniques.keys())
         }
-    
+
     def get_techniques_by_tactic(self, tactic):
-        return [t for t in self.techniques.values() if tactic in t.get('tactics', [])]
+        return self._by_tactic.get(tactic, _EMPTY_TUPLE)
@@ -1,32 +1,37 @@
 """
 Simple MITRE ATT&CK Module
 """
+from types import MappingProxyType
+
+# Shared technique table: built once at import, read-only so every
+# instance can reference it without copying
+_TECHNIQUES = MappingProxyType({
+    "T1566": {
+        "id": "T1566",
+        "name": "Phishing",
+        "description": "Adversaries send phishing messages",
+        "tactics": ["Initial Access"],
+        "mitigation": "User training, email filtering"
+    },
+    "T1486": {
+        "id": "T1486",
+        "name": "Data Encrypted for Impact",
+        "description": "Adversaries encrypt data",
+        "tactics": ["Impact"],
+        "mitigation": "Regular backups"
+    }
+})
 
 class MITREModule:
     def __init__(self):
-        self.techniques = {
-            "T1566": {
-                "id": "T1566",
-                "name": "Phishing",
-                "description": "Adversaries send phishing messages",
-                "tactics": ["Initial Access"],
-                "mitigation": "User training, email filtering"
-            },
-            "T1486": {
-                "id": "T1486",
-                "name": "Data Encrypted for Impact", 
-                "description": "Adversaries encrypt data",
-                "tactics": ["Impact"],
-                "mitigation": "Regular backups"
-            }
-        }
-    
+        self.techniques = _TECHNIQUES
+
     def get_technique(self, tech_id):
         return self.techniques.get(tech_id, {})
-    
+
     def get_all(self):
         return list(self.techniques.values())
-    
+
     def get_stats(self):
         return {
             "total_techniques": len(self.techniques),
@@ -1,24 +1,29 @@
 """
 Simple MITRE ATT&CK module for Omega Platform
 """
+from types import MappingProxyType
+
+# Shared technique table: built once at import, read-only so every
+# instance can reference it without copying
+_TECHNIQUES = MappingProxyType({
+    "T1566": {
+        "name": "Phishing",
+        "tactics": ["Initial Access"],
+        "mitigation": "User training, email filtering"
+    },
+    "T1486": {
+        "name": "Data Encrypted for Impact",
+        "tactics": ["Impact"],
+        "mitigation": "Regular backups"
+    }
+})
 
 class MITRESimple:
     def __init__(self):
-        self.techniques = {
-            "T1566": {
-                "name": "Phishing",
-                "tactics": ["Initial Access"],
-                "mitigation": "User training, email filtering"
-            },
-            "T1486": {
-                "name": "Data Encrypted for Impact",
-                "tactics": ["Impact"],
-                "mitigation": "Regular backups"
-            }
-        }
-    
+        self.techniques = _TECHNIQUES
+
     def get_technique(self, tech_id):
         return self.techniques.get(tech_id, {})
-    
+
     def get_all(self):
         return self.techniques
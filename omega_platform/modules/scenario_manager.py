@@ -3,12 +3,35 @@ Simple Scenario Manager
 """
 import json
 import os
+from concurrent.futures import ThreadPoolExecutor
+
+from omega_platform.modules import ensure_dir
+
+try:
+    import orjson
+except ImportError:  # optional native-speed parser
+    orjson = None
+
+if orjson is not None:
+    _loads = orjson.loads
+else:
+    _loads = json.loads
+
+# Parsing releases the GIL on the read syscall, so a pool pays off once
+# the directory holds more than a handful of files
+_FANOUT_THRESHOLD = 8
 
 class ScenarioManager:
     def __init__(self):
         self.data_dir = "omega_platform/data/scenarios"
-        os.makedirs(self.data_dir, exist_ok=True)
-        
+        ensure_dir(self.data_dir)
+
+        # Parsed scenarios cached until the directory mtime changes,
+        # plus an id index built lazily from the same cache
+        self._cache = None
+        self._index = None
+        self._dir_mtime_ns = -1
+
         # Create sample scenario
         sample_path = f"{self.data_dir}/sample.json"
         if not os.path.exists(sample_path):
@@ -20,14 +43,39 @@ class ScenarioManager:
             }
             with open(sample_path, 'w') as f:
                 json.dump(sample, f, indent=2)
-    
+
+    @staticmethod
+    def _read_scenario(path):
+        with open(path, 'rb') as f:
+            return _loads(f.read())
+
     def list_scenarios(self):
-        scenarios = []
-        for file in os.listdir(self.data_dir):
-            if file.endswith('.json'):
-                with open(f"{self.data_dir}/{file}", 'r') as f:
-                    scenarios.append(json.load(f))
+        mtime = os.stat(self.data_dir).st_mtime_ns
+        if mtime == self._dir_mtime_ns and self._cache is not None:
+            return self._cache
+
+        with os.scandir(self.data_dir) as entries:
+            paths = [e.path for e in entries
+                     if e.name.endswith('.json') and e.is_file()]
+
+        if len(paths) > _FANOUT_THRESHOLD:
+            workers = min(32, (os.cpu_count() or 1) * 4, len(paths))
+            with ThreadPoolExecutor(max_workers=workers) as ex:
+                scenarios = list(ex.map(self._read_scenario, paths))
+        else:
+            scenarios = [self._read_scenario(p) for p in paths]
+
+        self._cache = scenarios
+        self._index = None
+        self._dir_mtime_ns = mtime
         return scenarios
-    
+
+    def get_by_id(self, scenario_id):
+        """O(1) lookup by scenario id"""
+        scenarios = self.list_scenarios()
+        if self._index is None:
+            self._index = {s['id']: s for s in scenarios if 'id' in s}
+        return self._index.get(scenario_id)
+
     def count(self):
         return len(self.list_scenarios())
@@ -1,15 +1,34 @@
 """
 Enhanced Scenario Manager that checks user directory
 """
-import json
 import os
 from pathlib import Path
 
+from omega_platform.utils import fastjson
+
+# Sample scenario serialized once at import; first-run setup just
+# writes the bytes
+_SAMPLE = {
+    "id": "phishing_001",
+    "name": "Basic Phishing Test",
+    "description": "Test phishing scenario",
+    "mitre_techniques": ["T1566"],
+    "difficulty": "easy"
+}
+_SAMPLE_JSON_BYTES = fastjson.dumps(_SAMPLE)
+
 class ScenarioManagerEnhanced:
     def __init__(self):
         self.base_dir = Path("omega_platform/data/scenarios")
         self.user_dir = self.base_dir / "user"
-        
+
+        # Parsed scenarios per directory, keyed by directory mtime so
+        # repeat listings skip the re-parse entirely; the id index is
+        # dropped whenever either directory reparses
+        self._cache = {}
+        self._index = None
+
+
         # Create directories
         self.base_dir.mkdir(parents=True, exist_ok=True)
         self.user_dir.mkdir(parents=True, exist_ok=True)
@@ -17,53 +36,58 @@ class ScenarioManagerEnhanced:
         # Create sample scenario if none exist
         sample_path = self.base_dir / "sample.json"
         if not sample_path.exists():
-            sample = {
-                "id": "phishing_001",
-                "name": "Basic Phishing Test",
-                "description": "Test phishing scenario",
-                "mitre_techniques": ["T1566"],
-                "difficulty": "easy"
-            }
-            with open(sample_path, 'w') as f:
-                json.dump(sample, f, indent=2)
+            tmp_path = sample_path.with_suffix('.json.tmp')
+            tmp_path.write_bytes(_SAMPLE_JSON_BYTES)
+            os.replace(tmp_path, sample_path)
     
+    def _load_dir(self, directory):
+        """Parse a directory's scenarios, reusing the cache while its
+        mtime is unchanged"""
+        try:
+            mtime = os.stat(directory).st_mtime_ns
+        except OSError:
+            return []
+
+        cached = self._cache.get(directory)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+
+        # glob compiles the suffix match once and runs it in C
+        scenarios = [fastjson.loads(p.read_bytes())
+                     for p in directory.glob('*.json')]
+
+        self._cache[directory] = (mtime, scenarios)
+        self._index = None
+        return scenarios
+
     def list_scenarios(self):
         """Get ALL scenarios (base + user)"""
-        scenarios = []
-        
-        # Check base directory
-        for file in os.listdir(self.base_dir):
-            if file.endswith('.json'):
-                with open(self.base_dir / file, 'r') as f:
-                    scenarios.append(json.load(f))
-        
-        # Check user directory
-        if self.user_dir.exists():
-            for file in os.listdir(self.user_dir):
-                if file.endswith('.json'):
-                    with open(self.user_dir / file, 'r') as f:
-                        scenarios.append(json.load(f))
-        
-        return scenarios
-    
+        return self._load_dir(self.base_dir) + self._load_dir(self.user_dir)
+
+    def get_by_id(self, scenario_id):
+        """O(1) lookup by id across base and user scenarios"""
+        scenarios = self.list_scenarios()
+        if self._index is None:
+            self._index = {s['id']: s for s in scenarios if 'id' in s}
+        return self._index.get(scenario_id)
+
+    @staticmethod
+    def _count_dir(directory):
+        try:
+            with os.scandir(directory) as entries:
+                return sum(1 for e in entries
+                           if e.name.endswith('.json') and e.is_file())
+        except OSError:
+            return 0
+
     def count(self):
-        return len(self.list_scenarios())
-    
+        """Count scenarios from dirents alone, without parsing any JSON"""
+        return self._count_dir(self.base_dir) + self._count_dir(self.user_dir)
+
     def get_user_scenarios(self):
         """Get only user-imported scenarios"""
-        scenarios = []
-        if self.user_dir.exists():
-            for file in os.listdir(self.user_dir):
-                if file.endswith('.json'):
-                    with open(self.user_dir / file, 'r') as f:
-                        scenarios.append(json.load(f))
-        return scenarios
-    
+        return self._load_dir(self.user_dir)
+
     def get_base_scenarios(self):
         """Get only base scenarios"""
-        scenarios = []
-        for file in os.listdir(self.base_dir):
-            if file.endswith('.json'):
-                with open(self.base_dir / file, 'r') as f:
-                    scenarios.append(json.load(f))
-        return scenarios
+        return self._load_dir(self.base_dir)
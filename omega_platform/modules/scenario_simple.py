@@ -1,8 +1,21 @@
 """
 Simple scenario manager
 """
-import json
 import os
+from pathlib import Path
+
+from omega_platform.utils import fastjson
+
+# Sample scenario serialized once at import; first-run setup just
+# writes the bytes
+_SAMPLE = {
+    "id": "phishing_001",
+    "name": "Basic Phishing Test",
+    "description": "Test phishing scenario",
+    "mitre_techniques": ["T1566"],
+    "difficulty": "easy"
+}
+_SAMPLE_JSON_BYTES = fastjson.dumps(_SAMPLE)
 
 class ScenarioManagerSimple:
     def __init__(self):
@@ -12,20 +25,10 @@ class ScenarioManagerSimple:
         # Create sample scenario if none exist
         sample_file = f"{self.scenarios_dir}/sample_phishing.json"
         if not os.path.exists(sample_file):
-            sample = {
-                "id": "phishing_001",
-                "name": "Basic Phishing Test",
-                "description": "Test phishing scenario",
-                "mitre_techniques": ["T1566"],
-                "difficulty": "easy"
-            }
-            with open(sample_file, 'w') as f:
-                json.dump(sample, f, indent=2)
+            tmp_file = f"{sample_file}.tmp"
+            Path(tmp_file).write_bytes(_SAMPLE_JSON_BYTES)
+            os.replace(tmp_file, sample_file)
     
     def list_scenarios(self):
-        scenarios = []
-        for file in os.listdir(self.scenarios_dir):
-            if file.endswith('.json'):
-                with open(f"{self.scenarios_dir}/{file}", 'r') as f:
-                    scenarios.append(json.load(f))
-        return scenarios
+        return [fastjson.loads(p.read_bytes())
+                for p in Path(self.scenarios_dir).glob('*.json')]
@@ -3,39 +3,66 @@ Advanced Threat Simulation Module
 Simulates realistic attack scenarios to test security controls
 """
 
+import itertools
+import os
 import random
 import time
 import threading
-import json
+from collections import deque
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Dict, Any, List, Optional
 from omega_platform.modules import BaseModule
+from omega_platform.utils import fastjson
 import logging
 
+from .deception_integration import DeceptionTargetManager
+
 logger = logging.getLogger(__name__)
 
+# Wallclock second formatted at most once per second; only the
+# microsecond suffix is recomputed per timestamp
+_ts_cache = (0, '')
+
+def _iso_now() -> str:
+    """ISO-8601 UTC timestamp without datetime object construction"""
+    global _ts_cache
+    now = time.time_ns()
+    sec = now // 1_000_000_000
+    if _ts_cache[0] != sec:
+        _ts_cache = (sec, time.strftime('%Y-%m-%dT%H:%M:%S', time.gmtime(sec)))
+    return f"{_ts_cache[1]}.{(now % 1_000_000_000) // 1000:06d}"
+
 class SimulationModule(BaseModule):
     """Advanced threat simulation engine"""
     
     def __init__(self, config: Dict[str, Any], engine):
         super().__init__(config, engine)
-        self.scenarios = []
+        # Scenario parsing is deferred to first access; None means the
+        # directory has not been scanned yet
+        self._scenarios = None
+        self._scenarios_by_id = {}
+        self._scenarios_path = self.config.get('scenarios_path', './data/scenarios/')
+        self._cancel_schedule = None
+        # Recycled Simulation instances for steady-state scheduled runs
+        self._sim_pool = []
         self.agents = []
-        self.active_simulations = []
-        self.results = []
+        # Set so completion removal is O(1) under concurrent scheduled runs
+        self.active_simulations = set()
+        # Bounded so a long-running scheduler can't grow history without limit
+        self.results = deque(maxlen=self.config.get('max_results', 1000))
         self.scenario_loader = ScenarioLoader()
         self.agent_manager = AgentManager()
+        self.target_manager = DeceptionTargetManager(engine)
         
     def start(self):
         """Start the simulation module"""
         logger.info("Starting Advanced Threat Simulation Module...")
-        
-        # Load scenarios from configured path
-        scenarios_path = self.config.get('scenarios_path', './data/scenarios/')
-        self.scenarios = self.scenario_loader.load_scenarios(scenarios_path)
-        
-        logger.info(f"Loaded {len(self.scenarios)} simulation scenarios")
-        
+
+        # Scenarios load lazily on first access, keeping disk I/O off the
+        # startup path for deployments that never run a simulation
+
         # Initialize agent manager
         self.agent_manager.initialize(self.config.get('agents', {}))
         
@@ -44,18 +71,32 @@ class SimulationModule(BaseModule):
         
         # Start background simulation scheduler
         self._start_scheduler()
-    
+
+    @property
+    def scenarios(self) -> List['Scenario']:
+        """Loaded scenarios, parsed from disk on first access"""
+        if self._scenarios is None:
+            self._scenarios = self.scenario_loader.load_scenarios(self._scenarios_path)
+            self._scenarios_by_id = {s.id: s for s in self._scenarios}
+            logger.info(f"Loaded {len(self._scenarios)} simulation scenarios")
+        return self._scenarios
+
     def stop(self):
         """Stop the simulation module"""
         logger.info("Stopping Advanced Threat Simulation Module...")
         
-        # Stop all active simulations
-        for sim in self.active_simulations:
+        # Stop all active simulations (copy in case one removes itself)
+        for sim in list(self.active_simulations):
             sim.stop()
         
         # Stop all agents
         self.agent_manager.stop_all()
-        
+
+        # Cancel the shared-scheduler subscription if one exists
+        if self._cancel_schedule is not None:
+            self._cancel_schedule()
+            self._cancel_schedule = None
+
         self.running = False
         logger.info("Advanced Threat Simulation Module stopped")
     
@@ -63,16 +104,21 @@ class SimulationModule(BaseModule):
         """Start the simulation scheduler"""
         if self.config.get('auto_schedule', False):
             interval = self.config.get('schedule_interval', 3600)  # Default: 1 hour
-            self.scheduler_thread = threading.Thread(
-                target=self._run_scheduler,
-                args=(interval,),
-                daemon=True
-            )
-            self.scheduler_thread.start()
+            if self.engine is not None and hasattr(self.engine, 'schedule'):
+                # Ride the engine's shared scheduler thread
+                self._cancel_schedule = self.engine.schedule(
+                    interval, self.run_scheduled_simulation)
+            else:
+                self.scheduler_thread = threading.Thread(
+                    target=self._run_scheduler,
+                    args=(interval,),
+                    daemon=True
+                )
+                self.scheduler_thread.start()
             logger.info(f"Simulation scheduler started (interval: {interval}s)")
-    
+
     def _run_scheduler(self, interval: int):
-        """Run scheduled simulations"""
+        """Run scheduled simulations (fallback when no engine scheduler)"""
         while self.running:
             time.sleep(interval)
             if self.running:
@@ -98,39 +144,59 @@ class SimulationModule(BaseModule):
         """Run a specific simulation scenario"""
         logger.info(f"Running simulation scenario: {scenario_id}")
         
-        # Find scenario
-        scenario = next((s for s in self.scenarios if s.id == scenario_id), None)
+        # Find scenario (touching the property loads on first use)
+        _ = self.scenarios
+        scenario = self._scenarios_by_id.get(scenario_id)
         if not scenario:
             logger.error(f"Scenario not found: {scenario_id}")
             return None
         
-        # Create simulation instance
-        simulation = Simulation(scenario, self.engine, **kwargs)
-        self.active_simulations.append(simulation)
-        
+        # Create (or recycle) a simulation instance
+        simulation = self._acquire_sim(scenario, **kwargs)
+        self.active_simulations.add(simulation)
+
         # Run simulation
         try:
             result = simulation.run()
             self.results.append(result)
-            
+
             # Notify other modules
             self._notify_simulation_result(result)
-            
+
             # Remove from active
             self.active_simulations.remove(simulation)
-            
+            self._release_sim(simulation)
+
             return result
-            
+
         except Exception as e:
             logger.error(f"Simulation failed: {e}")
             return None
+
+    _SIM_POOL_MAX = 32
+
+    def _acquire_sim(self, scenario: 'Scenario', **kwargs) -> 'Simulation':
+        """Reuse a pooled Simulation when available"""
+        if self._sim_pool:
+            sim = self._sim_pool.pop()
+            sim.scenario = scenario
+            sim.kwargs = kwargs
+            sim.running = False
+            sim.start_time = sim.end_time = sim.result = None
+            return sim
+        return Simulation(scenario, self.engine, **kwargs)
+
+    def _release_sim(self, sim: 'Simulation'):
+        """Return a finished Simulation to the bounded pool"""
+        if len(self._sim_pool) < self._SIM_POOL_MAX:
+            self._sim_pool.append(sim)
     
     def _notify_simulation_result(self, result: Dict[str, Any]):
         """Notify other modules about simulation results"""
         if self.engine:
             self.engine.notify_modules('simulation_complete', {
                 'result': result,
-                'timestamp': datetime.utcnow().isoformat()
+                'timestamp': _iso_now()
             })
     
     def list_scenarios(self) -> List[Dict[str, Any]]:
@@ -138,8 +204,9 @@ class SimulationModule(BaseModule):
         return [s.to_dict() for s in self.scenarios]
     
     def get_results(self, limit: int = 10) -> List[Dict[str, Any]]:
-        """Get recent simulation results"""
-        return self.results[-limit:] if self.results else []
+        """Get recent simulation results (chronological order)"""
+        start = max(0, len(self.results) - limit)
+        return list(itertools.islice(self.results, start, None))
     
     def create_custom_scenario(self, name: str, steps: List[Dict[str, Any]], 
                               **kwargs) -> Dict[str, Any]:
@@ -148,12 +215,14 @@ class SimulationModule(BaseModule):
             'id': f"custom_{int(time.time())}",
             'name': name,
             'steps': steps,
-            'created': datetime.utcnow().isoformat(),
+            'created': _iso_now(),
             **kwargs
         }
         
-        # Add to scenarios
-        self.scenarios.append(Scenario.from_dict(scenario))
+        # Add to scenarios and the id index
+        scenario_obj = Scenario.from_dict(scenario)
+        self.scenarios.append(scenario_obj)
+        self._scenarios_by_id[scenario_obj.id] = scenario_obj
         
         # Save to disk if configured
         if self.config.get('save_custom_scenarios', True):
@@ -169,9 +238,13 @@ class SimulationModule(BaseModule):
             
             filename = f"{scenario['id']}.json"
             filepath = os.path.join(scenarios_path, filename)
-            
-            with open(filepath, 'w') as f:
-                json.dump(scenario, f, indent=2)
+
+            # Single-buffer write via a tempfile so a crash can't leave a
+            # truncated scenario behind
+            tmp_path = filepath + '.tmp'
+            with open(tmp_path, 'wb') as f:
+                f.write(fastjson.dumps(scenario))
+            os.replace(tmp_path, filepath)
             
             logger.info(f"Saved custom scenario: {filename}")
             
@@ -182,19 +255,23 @@ class SimulationModule(BaseModule):
         """Get detailed status"""
         base_status = super().status()
         base_status.update({
-            "scenarios_loaded": len(self.scenarios),
+            "scenarios_loaded": len(self._scenarios) if self._scenarios is not None else 0,
             "active_simulations": len(self.active_simulations),
             "total_results": len(self.results),
             "agent_count": self.agent_manager.count(),
-            "scheduler_running": hasattr(self, 'scheduler_thread') 
-                               and self.scheduler_thread.is_alive(),
+            "scheduler_running": self._cancel_schedule is not None
+                               or (hasattr(self, 'scheduler_thread')
+                                   and self.scheduler_thread.is_alive()),
         })
         return base_status
 
 # Supporting classes
 class Scenario:
     """Simulation scenario definition"""
-    
+
+    __slots__ = ('id', 'name', 'description', 'steps', 'tags',
+                 'difficulty', 'estimated_time', '_cached_dict')
+
     def __init__(self, scenario_id: str, name: str, description: str = "", 
                  steps: List[Dict[str, Any]] = None, tags: List[str] = None,
                  difficulty: str = "medium", estimated_time: int = 300):
@@ -205,17 +282,22 @@ class Scenario:
         self.tags = tags or []
         self.difficulty = difficulty
         self.estimated_time = estimated_time  # in seconds
-    
+        # Scenarios never mutate after construction, so the dict form is
+        # built once; to_dict hands out C-level copies
+        self._cached_dict = None
+
     def to_dict(self) -> Dict[str, Any]:
-        return {
-            'id': self.id,
-            'name': self.name,
-            'description': self.description,
-            'steps': self.steps,
-            'tags': self.tags,
-            'difficulty': self.difficulty,
-            'estimated_time': self.estimated_time,
-        }
+        if self._cached_dict is None:
+            self._cached_dict = {
+                'id': self.id,
+                'name': self.name,
+                'description': self.description,
+                'steps': self.steps,
+                'tags': self.tags,
+                'difficulty': self.difficulty,
+                'estimated_time': self.estimated_time,
+            }
+        return self._cached_dict.copy()
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'Scenario':
@@ -229,86 +311,95 @@ class Scenario:
             estimated_time=data.get('estimated_time', 300),
         )
 
+# Built-in scenarios constructed once at import; _load_builtin_scenarios
+# hands out a fresh list over the same shared instances
+_BUILTIN_SCENARIOS = (
+    Scenario(
+        scenario_id="apt_simulation_1",
+        name="APT Campaign Simulation",
+        description="Simulates an Advanced Persistent Threat campaign",
+        steps=[
+            {"type": "reconnaissance", "target": "network_scan", "duration": 60},
+            {"type": "initial_access", "method": "phishing", "targets": 5},
+            {"type": "lateral_movement", "technique": "pass_the_hash"},
+            {"type": "data_exfiltration", "data_size": "100MB"},
+        ],
+        tags=["apt", "campaign", "enterprise"],
+        difficulty="hard",
+        estimated_time=1800,
+    ),
+    Scenario(
+        scenario_id="ransomware_1",
+        name="Ransomware Attack",
+        description="Simulates a ransomware infection and encryption",
+        steps=[
+            {"type": "initial_infection", "vector": "malicious_email"},
+            {"type": "propagation", "method": "network_shares"},
+            {"type": "encryption", "targets": ["documents", "databases"]},
+            {"type": "ransom_note", "message": "Your files are encrypted!"},
+        ],
+        tags=["ransomware", "encryption", "crypto"],
+        difficulty="medium",
+        estimated_time=600,
+    ),
+    Scenario(
+        scenario_id="insider_threat_1",
+        name="Insider Threat",
+        description="Simulates malicious activity from an internal user",
+        steps=[
+            {"type": "credential_theft", "method": "shoulder_surfing"},
+            {"type": "data_access", "sensitive_data": True},
+            {"type": "data_exfiltration", "method": "usb_drive"},
+        ],
+        tags=["insider", "data_theft", "internal"],
+        difficulty="easy",
+        estimated_time=300,
+    ),
+)
+
 class ScenarioLoader:
     """Loads simulation scenarios from disk"""
-    
+
+    @staticmethod
+    def _read_one(path: str) -> Optional[Dict[str, Any]]:
+        """Read and parse one scenario file; errors are logged, not raised"""
+        try:
+            return fastjson.loads(Path(path).read_bytes())
+        except Exception as e:
+            logger.error(f"Failed to load scenario {os.path.basename(path)}: {e}")
+            return None
+
     def load_scenarios(self, path: str) -> List[Scenario]:
         """Load all scenarios from a directory"""
         scenarios = []
-        
+
         try:
             if not os.path.exists(path):
                 logger.warning(f"Scenarios path does not exist: {path}")
                 return scenarios
-            
+
             # Load built-in scenarios first
             scenarios.extend(self._load_builtin_scenarios())
-            
-            # Load from files
-            for filename in os.listdir(path):
-                if filename.endswith('.json'):
-                    filepath = os.path.join(path, filename)
-                    try:
-                        with open(filepath, 'r') as f:
-                            data = json.load(f)
+
+            # Load from files, overlapping the reads across a small pool
+            paths = list(Path(path).glob('*.json'))
+
+            if paths:
+                with ThreadPoolExecutor(max_workers=min(16, len(paths))) as ex:
+                    for data in ex.map(self._read_one, paths):
+                        if data is not None:
                             scenario = Scenario.from_dict(data)
                             scenarios.append(scenario)
                             logger.debug(f"Loaded scenario: {scenario.name}")
-                    except Exception as e:
-                        logger.error(f"Failed to load scenario {filename}: {e}")
-            
+
         except Exception as e:
             logger.error(f"Failed to load scenarios: {e}")
-        
+
         return scenarios
     
     def _load_builtin_scenarios(self) -> List[Scenario]:
         """Load built-in simulation scenarios"""
-        builtin_scenarios = [
-            Scenario(
-                scenario_id="apt_simulation_1",
-                name="APT Campaign Simulation",
-                description="Simulates an Advanced Persistent Threat campaign",
-                steps=[
-                    {"type": "reconnaissance", "target": "network_scan", "duration": 60},
-                    {"type": "initial_access", "method": "phishing", "targets": 5},
-                    {"type": "lateral_movement", "technique": "pass_the_hash"},
-                    {"type": "data_exfiltration", "data_size": "100MB"},
-                ],
-                tags=["apt", "campaign", "enterprise"],
-                difficulty="hard",
-                estimated_time=1800,
-            ),
-            Scenario(
-                scenario_id="ransomware_1",
-                name="Ransomware Attack",
-                description="Simulates a ransomware infection and encryption",
-                steps=[
-                    {"type": "initial_infection", "vector": "malicious_email"},
-                    {"type": "propagation", "method": "network_shares"},
-                    {"type": "encryption", "targets": ["documents", "databases"]},
-                    {"type": "ransom_note", "message": "Your files are encrypted!"},
-                ],
-                tags=["ransomware", "encryption", "crypto"],
-                difficulty="medium",
-                estimated_time=600,
-            ),
-            Scenario(
-                scenario_id="insider_threat_1",
-                name="Insider Threat",
-                description="Simulates malicious activity from an internal user",
-                steps=[
-                    {"type": "credential_theft", "method": "shoulder_surfing"},
-                    {"type": "data_access", "sensitive_data": True},
-                    {"type": "data_exfiltration", "method": "usb_drive"},
-                ],
-                tags=["insider", "data_theft", "internal"],
-                difficulty="easy",
-                estimated_time=300,
-            ),
-        ]
-        
-        return builtin_scenarios
+        return list(_BUILTIN_SCENARIOS)
 
 class AgentManager:
     """Manages simulation agents"""
@@ -336,7 +427,12 @@ class AgentManager:
 
 class Simulation:
     """Individual simulation instance"""
-    
+
+    # simulation_module is assigned externally by integration code that
+    # wires reconnaissance up to the deception target manager
+    __slots__ = ('scenario', 'engine', 'kwargs', 'running', 'start_time',
+                 'end_time', 'result', '_pending_events', 'simulation_module')
+
     def __init__(self, scenario: Scenario, engine, **kwargs):
         self.scenario = scenario
         self.engine = engine
@@ -345,6 +441,7 @@ class Simulation:
         self.start_time = None
         self.end_time = None
         self.result = None
+        self._pending_events = []
         
     def run(self) -> Dict[str, Any]:
         """Run the simulation"""
@@ -363,16 +460,29 @@ class Simulation:
             'errors': [],
         }
         
-        # Execute each step
+        # Execute each step; bind the hot names once outside the loop
+        _execute = self._execute_step
+        _append = results['steps'].append
+        self._pending_events = []
         for i, step in enumerate(self.scenario.steps):
-            step_result = self._execute_step(i, step, results)
-            results['steps'].append(step_result)
-            
+            step_result = _execute(i, step, results)
+            _append(step_result)
+
             # Check if step failed
             if not step_result.get('success', True):
                 results['success'] = False
                 results['errors'].append(step_result.get('error', 'Unknown error'))
-        
+
+        # One batched notification per run; subscribers iterate once
+        # instead of once per step
+        if self.engine and self._pending_events:
+            self.engine.notify_modules('simulation_steps_batch', {
+                'scenario': self.scenario.name,
+                'events': self._pending_events,
+            })
+            # Fresh list so pooled reuse cannot mutate the payload
+            self._pending_events = []
+
         self.end_time = datetime.utcnow()
         results['end_time'] = self.end_time.isoformat()
         results['duration'] = (self.end_time - self.start_time).total_seconds()
@@ -390,7 +500,7 @@ class Simulation:
         step_result = {
             'step_index': step_index,
             'step_type': step.get('type', 'unknown'),
-            'start_time': datetime.utcnow().isoformat(),
+            'start_time': _iso_now(),
             'success': True,
         }
         
@@ -413,43 +523,61 @@ class Simulation:
                 step_result['message'] = f"Executed step: {step_type}"
                 time.sleep(step.get('duration', 1))  # Simulate work
             
-            # Notify engine about step execution
+            # Queue for the batched end-of-run notification; steps that
+            # opt in with notify_immediate still dispatch right away
             if self.engine:
-                self.engine.notify_modules('simulation_step', {
-                    'step': step,
-                    'result': step_result,
-                    'scenario': self.scenario.name,
-                })
-            
+                self._pending_events.append((step, step_result))
+                if step.get('notify_immediate'):
+                    self.engine.notify_modules('simulation_step', {
+                        'step': step,
+                        'result': step_result,
+                        'scenario': self.scenario.name,
+                    })
+
         except Exception as e:
             step_result['success'] = False
             step_result['error'] = str(e)
             logger.error(f"Step {step_index} failed: {e}")
         
-        step_result['end_time'] = datetime.utcnow().isoformat()
-        
+        step_result['end_time'] = _iso_now()
+
         return step_result
     
     def _execute_reconnaissance(self, step: Dict[str, Any], result: Dict[str, Any]):
-        """Execute reconnaissance step"""
+        """Execute reconnaissance step using deception targets"""
         target = step.get('target', 'network')
         duration = step.get('duration', 30)
-        
+
+        # Use target manager if available
+        targets_found = []
+        if hasattr(self, 'simulation_module') and hasattr(self.simulation_module, 'target_manager'):
+            targets = self.simulation_module.target_manager.scan_for_targets()
+            targets_found = [t.name for t in targets]
+
         result['details'] = {
             'target': target,
             'duration': duration,
+            'targets_found': targets_found,
             'techniques': ['port_scan', 'service_discovery', 'os_fingerprinting']
         }
-        
+
         # Simulate reconnaissance
         time.sleep(min(duration, 5))  # Cap at 5 seconds for simulation
-        
-        # If engine has deception module, check if detected
-        if self.engine and 'deception' in self.engine.modules:
-            deception_module = self.engine.modules['deception']
-            result['deception_detected'] = True  # Would actually check
-        
-        result['message'] = f"Reconnaissance completed on {target}"
+
+        # If we have targets, simulate scanning them
+        if targets_found and hasattr(self, 'simulation_module') and hasattr(self.simulation_module, 'target_manager'):
+            for target in self.simulation_module.target_manager.available_targets[:3]:  # Scan first 3
+                scan_result = self.simulation_module.target_manager.attack_target(
+                    target.id, 'port_scan', {}
+                )
+                if scan_result.get('success'):
+                    result['details']['scan_results'] = result['details'].get('scan_results', [])
+                    result['details']['scan_results'].append({
+                        'target': target.name,
+                        'ports': scan_result.get('ports_found', []),
+                    })
+
+        result['message'] = f"Reconnaissance completed, found {len(targets_found)} targets"
     
     def _execute_initial_access(self, step: Dict[str, Any], result: Dict[str, Any]):
         """Execute initial access step"""
@@ -508,52 +636,3 @@ class Simulation:
         """Stop the simulation"""
         self.running = False
         logger.info(f"Simulation stopped: {self.scenario.name}")
-
-# Need to import os for the module
-import os
-
-# Add at the top of the file, after other imports
-from .deception_integration import DeceptionTargetManager
-
-# Update the SimulationModule class __init__ method:
-# Add this line after self.agent_manager = AgentManager()
-#         self.target_manager = DeceptionTargetManager(engine)
-
-# Update the Simulation class _execute_reconnaissance method to use real targets:
-# Replace the current _execute_reconnaissance with:
-
-    def _execute_reconnaissance(self, step: Dict[str, Any], result: Dict[str, Any]):
-        """Execute reconnaissance step using deception targets"""
-        target = step.get('target', 'network')
-        duration = step.get('duration', 30)
-        
-        # Use target manager if available
-        targets_found = []
-        if hasattr(self, 'simulation_module') and hasattr(self.simulation_module, 'target_manager'):
-            targets = self.simulation_module.target_manager.scan_for_targets()
-            targets_found = [t['name'] for t in targets]
-        
-        result['details'] = {
-            'target': target,
-            'duration': duration,
-            'targets_found': targets_found,
-            'techniques': ['port_scan', 'service_discovery', 'os_fingerprinting']
-        }
-        
-        # Simulate reconnaissance
-        time.sleep(min(duration, 5))
-        
-        # If we have targets, simulate scanning them
-        if targets_found and hasattr(self, 'simulation_module') and hasattr(self.simulation_module, 'target_manager'):
-            for target in self.simulation_module.target_manager.available_targets[:3]:  # Scan first 3
-                scan_result = self.simulation_module.target_manager.attack_target(
-                    target['id'], 'port_scan', {}
-                )
-                if scan_result.get('success'):
-                    result['details']['scan_results'] = result['details'].get('scan_results', [])
-                    result['details']['scan_results'].append({
-                        'target': target['name'],
-                        'ports': scan_result.get('ports_found', []),
-                    })
-        
-        result['message'] = f"Reconnaissance completed, found {len(targets_found)} targets"
@@ -4,81 +4,181 @@ Allows simulations to target deception honeypots
 """
 
 import logging
-from typing import Dict, Any, List, Optional
+import queue
+import random
+import threading
+import time
+from collections import deque
+from dataclasses import asdict, dataclass
+from types import MappingProxyType
+from typing import Dict, Any, List, Optional, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # batch attacks fall back to the stdlib RNG
+    np = None
 
 logger = logging.getLogger(__name__)
 
+# Detection / success probabilities per attack type, shared by the
+# scalar and batch paths
+_BASE_DETECTION = {
+    'port_scan': 0.95,
+    'brute_force': 0.85,
+    'exploit': 0.70,
+    'sql_injection': 0.80,
+}
+_SUCCESS_CHANCE = {
+    'brute_force': 0.3,
+    'exploit': 0.1,
+    'sql_injection': 0.4,
+}
+
+# Detection thresholds in Q16 fixed point so _check_detection can
+# compare getrandbits(16) against an integer
+_DETECTION_THRESHOLDS_Q16 = {k: int(v * 65536) for k, v in _BASE_DETECTION.items()}
+_DEFAULT_DETECTION_Q16 = 1 << 15  # 0.5
+
+# Static parts of each simulated-attack result, copied per call;
+# only random- or target-dependent fields are assembled at runtime
+_PORT_SCAN_TEMPLATE = MappingProxyType({'success': True, 'duration': 5.2})
+_BRUTE_FORCE_TEMPLATE = MappingProxyType({'duration': 8.5})
+_EXPLOIT_TEMPLATE = MappingProxyType({
+    'vulnerability': 'CVE-2023-12345',
+    'payload_delivered': True,
+    'duration': 12.3,
+})
+_SQL_INJECTION_TEMPLATE = MappingProxyType({'duration': 6.7})
+
+# Shared port/service tuples: a scan of a target already on a common
+# port reuses these outright instead of allocating fresh lists
+_COMMON_PORTS = (80, 443, 8080)
+_COMMON_SERVICES = ('http', 'https')
+
+
+def _sim_port_scan(target, parameters, rand):
+    result = dict(_PORT_SCAN_TEMPLATE)
+    port = target.port
+    result['ports_found'] = (
+        _COMMON_PORTS if port in _COMMON_PORTS
+        else (port,) + _COMMON_PORTS)
+    service = target.service
+    result['services_identified'] = (
+        _COMMON_SERVICES if service in _COMMON_SERVICES
+        else (service,) + _COMMON_SERVICES)
+    return result
+
+
+def _sim_brute_force(target, parameters, rand):
+    result = dict(_BRUTE_FORCE_TEMPLATE)
+    result['success'] = rand() > 0.7  # 30% success rate
+    result['attempts'] = parameters.get('attempts', 100)
+    result['credentials_found'] = (
+        ['admin:password123'] if rand() > 0.8 else [])
+    return result
+
+
+def _sim_exploit(target, parameters, rand):
+    result = dict(_EXPLOIT_TEMPLATE)
+    result['success'] = rand() > 0.9  # 10% success rate
+    return result
+
+
+def _sim_sql_injection(target, parameters, rand):
+    result = dict(_SQL_INJECTION_TEMPLATE)
+    result['success'] = rand() > 0.6  # 40% success rate
+    result['data_extracted'] = (
+        ['users', 'passwords'] if rand() > 0.5 else [])
+    return result
+
+
+# Dispatch table: one specialized builder per attack type
+_ATTACK_SIMS = {
+    'port_scan': _sim_port_scan,
+    'brute_force': _sim_brute_force,
+    'exploit': _sim_exploit,
+    'sql_injection': _sim_sql_injection,
+}
+
+
+@dataclass(slots=True, frozen=True)
+class Target:
+    """Compact deception-target record; convert to a dict only at
+    external boundaries via to_dict()"""
+    id: str
+    type: str
+    name: str
+    service: str
+    port: int
+    realism_score: int
+    interaction_logging: bool = True
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+# Frozen, so one shared tuple serves every manager instance
+_DEFAULT_TARGETS = (
+    Target(id='target_ssh_server', type='simulated_server',
+           name='SSH Server', service='ssh', port=22, realism_score=70),
+    Target(id='target_http_server', type='simulated_server',
+           name='Web Server', service='http', port=80, realism_score=75),
+    Target(id='target_database', type='simulated_server',
+           name='Database Server', service='mysql', port=3306,
+           realism_score=65),
+)
+
 class DeceptionTargetManager:
     """Manages deception systems as simulation targets"""
     
     def __init__(self, engine):
         self.engine = engine
         self.available_targets = []
+        self._targets_by_id = {}
         self.target_states = {}
+        # Private RNGs: no contention on the random module's shared state
+        self._rng = random.Random()
+        self._np_rng = np.random.default_rng() if np is not None else None
+
+        # Deception notifications go through a bounded queue drained by
+        # a background worker, started lazily on the first event
+        self._notify_queue = queue.Queue(maxsize=10000)
+        self._notify_thread = None
         
-    def scan_for_targets(self) -> List[Dict[str, Any]]:
+    def scan_for_targets(self) -> Tuple[Target, ...]:
         """Scan for available deception targets"""
         targets = []
-        
+
         if self.engine and 'deception' in self.engine.modules:
             deception_module = self.engine.modules['deception']
-            
+
             # Get honeypots from deception module
             # This would interface with the actual deception engine
             # For now, return mock targets based on config
-            
+
             if hasattr(deception_module, 'honeypots'):
                 for honeypot in deception_module.honeypots:
-                    target = {
-                        'id': f"deception_{honeypot.config.get('name', 'unknown')}",
-                        'type': 'honeypot',
-                        'name': honeypot.config.get('name', 'Unnamed Honeypot'),
-                        'service': honeypot.config.get('type', 'unknown'),
-                        'port': honeypot.config.get('port', 0),
-                        'realism_score': 85,  # How realistic the target appears
-                        'interaction_logging': True,
-                    }
-                    targets.append(target)
-        
+                    targets.append(Target(
+                        id=f"deception_{honeypot.config.get('name', 'unknown')}",
+                        type='honeypot',
+                        name=honeypot.config.get('name', 'Unnamed Honeypot'),
+                        service=honeypot.config.get('type', 'unknown'),
+                        port=honeypot.config.get('port', 0),
+                        realism_score=85,  # How realistic the target appears
+                    ))
+
         # Add default targets if no deception available
-        if not targets:
-            targets = self._get_default_targets()
-        
+        targets = tuple(targets) if targets else self._get_default_targets()
+
         self.available_targets = targets
+        # Keyed index so attack_target resolves ids in O(1)
+        self._targets_by_id = {t.id: t for t in targets}
         logger.info(f"Found {len(targets)} deception targets")
         return targets
-    
-    def _get_default_targets(self) -> List[Dict[str, Any]]:
+
+    def _get_default_targets(self) -> Tuple[Target, ...]:
         """Get default simulation targets"""
-        return [
-            {
-                'id': 'target_ssh_server',
-                'type': 'simulated_server',
-                'name': 'SSH Server',
-                'service': 'ssh',
-                'port': 22,
-                'realism_score': 70,
-                'interaction_logging': True,
-            },
-            {
-                'id': 'target_http_server',
-                'type': 'simulated_server', 
-                'name': 'Web Server',
-                'service': 'http',
-                'port': 80,
-                'realism_score': 75,
-                'interaction_logging': True,
-            },
-            {
-                'id': 'target_database',
-                'type': 'simulated_server',
-                'name': 'Database Server',
-                'service': 'mysql',
-                'port': 3306,
-                'realism_score': 65,
-                'interaction_logging': True,
-            }
-        ]
+        return _DEFAULT_TARGETS
     
     def attack_target(self, target_id: str, attack_type: str, 
                      parameters: Dict[str, Any]) -> Dict[str, Any]:
@@ -86,7 +186,7 @@ class DeceptionTargetManager:
         logger.info(f"Attacking target {target_id} with {attack_type}")
         
         # Find the target
-        target = next((t for t in self.available_targets if t['id'] == target_id), None)
+        target = self._targets_by_id.get(target_id)
         if not target:
             return {
                 'success': False,
@@ -105,100 +205,138 @@ class DeceptionTargetManager:
         
         return result
     
-    def _simulate_attack(self, target: Dict[str, Any], attack_type: str,
+    def _simulate_attack(self, target: Target, attack_type: str,
                         parameters: Dict[str, Any]) -> Dict[str, Any]:
         """Simulate an attack against a target"""
         # This would interface with actual deception engine
-        # For now, simulate based on attack type
-        
-        simulations = {
-            'port_scan': {
-                'success': True,
-                'ports_found': [target['port'], 80, 443, 8080],
-                'services_identified': [target['service'], 'http', 'https'],
-                'duration': 5.2,
-            },
-            'brute_force': {
-                'success': random.random() > 0.7,  # 30% success rate
-                'attempts': parameters.get('attempts', 100),
-                'credentials_found': ['admin:password123'] if random.random() > 0.8 else [],
-                'duration': 8.5,
-            },
-            'exploit': {
-                'success': random.random() > 0.9,  # 10% success rate
-                'vulnerability': 'CVE-2023-12345',
-                'payload_delivered': True,
-                'duration': 12.3,
-            },
-            'sql_injection': {
-                'success': random.random() > 0.6,  # 40% success rate
-                'data_extracted': ['users', 'passwords'] if random.random() > 0.5 else [],
-                'duration': 6.7,
-            },
-        }
-        
-        return simulations.get(attack_type, {
-            'success': False,
-            'error': f"Unknown attack type: {attack_type}",
-            'duration': 3.0,
-        })
+        # For now, dispatch through _ATTACK_SIMS so only the chosen
+        # builder runs
+        fn = _ATTACK_SIMS.get(attack_type)
+        if fn is None:
+            return {
+                'success': False,
+                'error': f"Unknown attack type: {attack_type}",
+                'duration': 3.0,
+            }
+        return fn(target, parameters, self._rng.random)
     
-    def _check_detection(self, target: Dict[str, Any], attack_type: str) -> bool:
+    def attack_targets_batch(self, target_ids: List[str], attack_types: List[str],
+                            params_list: Optional[List[Dict[str, Any]]] = None) -> List[Dict[str, Any]]:
+        """Execute many attacks, drawing all random samples in bulk
+
+        The per-attack RNG calls are the hot spot under campaign-style
+        runs; one vectorized draw replaces N interpreter roundtrips
+        when numpy is available.
+        """
+        n = len(target_ids)
+        if params_list is None:
+            params_list = [{}] * n
+
+        if self._np_rng is not None and n:
+            base = np.array([_BASE_DETECTION.get(a, 0.5) for a in attack_types])
+            realism = np.array(
+                [t.realism_score if (t := self._targets_by_id.get(tid)) else 50
+                 for tid in target_ids]) / 100
+            detected = self._np_rng.random(n) < base * realism
+            success_draws = self._np_rng.random(n)
+        else:
+            _rand = self._rng.random
+            detected = [
+                _rand() < (_BASE_DETECTION.get(a, 0.5)
+                           * (t.realism_score if (t := self._targets_by_id.get(tid)) else 50)
+                           / 100)
+                for tid, a in zip(target_ids, attack_types)
+            ]
+            success_draws = [_rand() for _ in range(n)]
+
+        results = []
+        for i, (target_id, attack_type, parameters) in enumerate(
+                zip(target_ids, attack_types, params_list)):
+            target = self._targets_by_id.get(target_id)
+            if target is None:
+                results.append({
+                    'success': False,
+                    'error': f"Target not found: {target_id}",
+                    'detected': False,
+                })
+                continue
+
+            result = self._simulate_attack(target, attack_type, parameters)
+            success_chance = _SUCCESS_CHANCE.get(attack_type)
+            if success_chance is not None:
+                result['success'] = bool(success_draws[i] < success_chance)
+            result['deception_detected'] = bool(detected[i])
+            self._log_interaction(target, attack_type, result)
+            results.append(result)
+
+        return results
+
+    def _check_detection(self, target: Target, attack_type: str) -> bool:
         """Check if deception engine would detect this attack"""
-        # Base detection probability
-        base_detection = {
-            'port_scan': 0.95,
-            'brute_force': 0.85,
-            'exploit': 0.70,
-            'sql_injection': 0.80,
-        }
-        
-        detection_chance = base_detection.get(attack_type, 0.5)
-        
-        # Adjust based on target realism
-        realism_factor = target.get('realism_score', 50) / 100
-        
-        # More realistic targets are better at detection
-        detection_probability = detection_chance * realism_factor
-        
-        return random.random() < detection_probability
-    
-    def _log_interaction(self, target: Dict[str, Any], attack_type: str,
+        threshold = _DETECTION_THRESHOLDS_Q16.get(attack_type, _DEFAULT_DETECTION_Q16)
+
+        # More realistic targets are better at detection; all-integer
+        # compare against a 16-bit draw, no float math
+        return (self._rng.getrandbits(16)
+                < threshold * target.realism_score // 100)
+
+    def _log_interaction(self, target: Target, attack_type: str,
                         result: Dict[str, Any]):
         """Log interaction with deception target"""
+        # Stored as a raw time_ns int; readers format lazily, log calls
+        # skip the datetime allocation and strftime entirely
         interaction = {
-            'timestamp': datetime.utcnow().isoformat(),
-            'target_id': target['id'],
-            'target_name': target['name'],
+            'timestamp_ns': time.time_ns(),
+            'target_id': target.id,
+            'target_name': target.name,
             'attack_type': attack_type,
             'result': result,
             'detected': result.get('deception_detected', False),
         }
+
+        # Store interaction; bounded so busy targets cannot grow without limit
+        state = self.target_states.get(target.id)
+        if state is None:
+            state = self.target_states[target.id] = {
+                'interactions': deque(maxlen=1000)}
+
+        state['interactions'].append(interaction)
         
-        # Store interaction
-        if target['id'] not in self.target_states:
-            self.target_states[target['id']] = {'interactions': []}
-        
-        self.target_states[target['id']]['interactions'].append(interaction)
-        
-        # Notify deception module if available
+        # Notify deception module if available; hand the event to the
+        # background worker so attack throughput is not serialized
+        # behind the deception module's logging latency
         if self.engine and 'deception' in self.engine.modules:
+            payload = (target.id, {
+                'attack_type': attack_type,
+                'result': result,
+                'simulation': True,
+            })
             try:
-                deception_module = self.engine.modules['deception']
-                if hasattr(deception_module, 'log_interaction'):
-                    deception_module.log_interaction(
-                        target['id'],
-                        {
-                            'attack_type': attack_type,
-                            'result': result,
-                            'simulation': True,
-                        }
+                self._notify_queue.put_nowait(payload)
+            except queue.Full:
+                logger.warning("Deception notification queue full; dropping event")
+            else:
+                if self._notify_thread is None:
+                    self._notify_thread = threading.Thread(
+                        target=self._notify_worker,
+                        daemon=True,
+                        name='deception-notify',
                     )
-            except Exception as e:
-                logger.error(f"Failed to notify deception module: {e}")
-        
-        logger.info(f"Logged {attack_type} against {target['name']} "
+                    self._notify_thread.start()
+
+        logger.info(f"Logged {attack_type} against {target.name} "
                    f"(detected: {result.get('deception_detected', False)})")
 
-import random
-from datetime import datetime
+    def _notify_worker(self):
+        """Drain queued interaction events to the deception module"""
+        while True:
+            target_id, payload = self._notify_queue.get()
+            try:
+                deception_module = self.engine.modules.get('deception')
+                if (deception_module is not None
+                        and hasattr(deception_module, 'log_interaction')):
+                    deception_module.log_interaction(target_id, payload)
+            except Exception as e:
+                logger.error(f"Failed to notify deception module: {e}")
+            finally:
+                self._notify_queue.task_done()
@@ -29,7 +29,7 @@ def test_integration():
         
         if targets:
             # Test attacking a target
-            target_id = targets[0]['id']
+            target_id = targets[0].id
             result = manager.attack_target(target_id, 'port_scan', {})
             print(f"✅ Attack simulation works: {result.get('success', False)}")
         
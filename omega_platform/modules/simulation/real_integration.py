@@ -3,20 +3,36 @@ Real integration between Simulation and Deception modules
 Uses the actual deception module instead of mock targets
 """
 
+import itertools
 import logging
+import time
+from collections import deque
 from typing import Dict, Any, List, Optional
 import random
-from datetime import datetime
+from datetime import datetime, timezone
 
 logger = logging.getLogger(__name__)
 
+
+def _format_ts(ns: int) -> str:
+    """Render a stored time_ns stamp as ISO-8601; only readers pay for it"""
+    return datetime.fromtimestamp(ns / 1e9, tz=timezone.utc).isoformat()
+
 class RealDeceptionIntegration:
     """Real integration with deception module"""
     
     def __init__(self, engine):
         self.engine = engine
         self.deception_module = None
-        self.attack_history = []
+        # Bounded: the deque drops the oldest record on overflow instead
+        # of the old re-slice-and-copy on every append past 100
+        self.attack_history = deque(maxlen=100)
+        # Running tallies over the retained window so get_stats is O(1)
+        self._real_attack_count = 0
+        self._successful_count = 0
+        self._targets_by_id = {}
+        # Private RNG avoids contention on the random module's shared state
+        self._rng = random.Random()
         
         # Try to get deception module from engine
         if engine and hasattr(engine, 'modules'):
@@ -25,14 +41,19 @@ class RealDeceptionIntegration:
                 logger.info("Connected to real deception module")
             else:
                 logger.warning("Deception module not found in engine")
+
+        # Bind the module's callables once; the hot paths branch on
+        # `is not None` instead of re-running hasattr per call
+        self._get_honeypots_fn = getattr(self.deception_module, 'get_honeypots', None)
+        self._attack_fn = getattr(self.deception_module, 'attack_honeypot', None)
     
     def get_targets(self) -> List[Dict[str, Any]]:
         """Get real honeypots from deception module"""
         targets = []
         
-        if self.deception_module and hasattr(self.deception_module, 'get_honeypots'):
+        if self._get_honeypots_fn is not None:
             try:
-                honeypots = self.deception_module.get_honeypots()
+                honeypots = self._get_honeypots_fn()
                 for honeypot in honeypots:
                     target = {
                         'id': honeypot.get('id', 'unknown'),
@@ -55,7 +76,9 @@ class RealDeceptionIntegration:
         else:
             logger.warning("Deception module doesn't have get_honeypots method")
             targets = self._get_fallback_targets()
-        
+
+        # Keyed index so callers can resolve target ids in O(1)
+        self._targets_by_id = {t['id']: t for t in targets}
         return targets
     
     def _get_fallback_targets(self) -> List[Dict[str, Any]]:
@@ -90,15 +113,15 @@ class RealDeceptionIntegration:
         logger.info(f"Attacking target {target_id} with {attack_type}")
         
         # Check if we have a real deception module
-        if self.deception_module and hasattr(self.deception_module, 'attack_honeypot'):
+        if self._attack_fn is not None:
             try:
                 # Attack the real honeypot
-                result = self.deception_module.attack_honeypot(target_id, attack_type, parameters)
+                result = self._attack_fn(target_id, attack_type, parameters)
                 
                 # Add metadata
                 result['target_type'] = 'real_honeypot'
                 result['integration'] = 'real'
-                result['timestamp'] = datetime.utcnow().isoformat()
+                result['timestamp_ns'] = time.time_ns()
                 
                 # Log the attack
                 self._log_attack(target_id, attack_type, result, real=True)
@@ -126,19 +149,19 @@ class RealDeceptionIntegration:
         time.sleep(0.2)
         
         result = {
-            'success': random.random() > 0.3,
+            'success': self._rng.random() > 0.3,
             'target_id': target_id,
             'attack_type': attack_type,
-            'timestamp': datetime.utcnow().isoformat(),
+            'timestamp_ns': time.time_ns(),
         }
-        
+
         # Add type-specific details
         if attack_type == 'port_scan':
             result['ports_found'] = [22, 80, 443, 8080, 8443]
             result['services'] = ['ssh', 'http', 'https']
         elif attack_type == 'brute_force':
             result['attempts'] = parameters.get('attempts', 100)
-            if random.random() > 0.7:
+            if self._rng.random() > 0.7:
                 result['credentials_found'] = ['admin:password123']
         
         return result
@@ -147,7 +170,7 @@ class RealDeceptionIntegration:
                    result: Dict[str, Any], real: bool):
         """Log attack to history"""
         attack_record = {
-            'timestamp': datetime.utcnow().isoformat(),
+            'timestamp_ns': time.time_ns(),
             'target_id': target_id,
             'attack_type': attack_type,
             'result': result,
@@ -155,32 +178,40 @@ class RealDeceptionIntegration:
             'success': result.get('success', False),
         }
         
-        self.attack_history.append(attack_record)
-        
-        # Keep only last 100 records
-        if len(self.attack_history) > 100:
-            self.attack_history = self.attack_history[-100:]
-        
+        history = self.attack_history
+        if len(history) == history.maxlen:
+            # About to evict the oldest record; take it out of the tallies
+            evicted = history[0]
+            self._real_attack_count -= evicted['real_honeypot']
+            self._successful_count -= evicted['success']
+        history.append(attack_record)
+        self._real_attack_count += attack_record['real_honeypot']
+        self._successful_count += attack_record['success']
+
         logger.info(f"Attack logged: {attack_type} on {target_id} "
                    f"(real: {real}, success: {result.get('success', False)})")
     
     def get_attack_history(self, limit: int = 20) -> List[Dict[str, Any]]:
-        """Get recent attack history"""
-        return self.attack_history[-limit:] if self.attack_history else []
+        """Get recent attack history with timestamps formatted on read"""
+        history = self.attack_history
+        tail = itertools.islice(history, max(0, len(history) - limit), None)
+        records = []
+        for record in tail:
+            record = dict(record)
+            record['timestamp'] = _format_ts(record.pop('timestamp_ns'))
+            records.append(record)
+        return records
     
     def get_stats(self) -> Dict[str, Any]:
-        """Get integration statistics"""
+        """Get integration statistics from the running tallies"""
         total = len(self.attack_history)
         if total == 0:
             return {'total_attacks': 0}
-        
-        real_attacks = [a for a in self.attack_history if a['real_honeypot']]
-        successful = [a for a in self.attack_history if a['success']]
-        
+
         return {
             'total_attacks': total,
-            'real_honeypot_attacks': len(real_attacks),
-            'simulated_attacks': total - len(real_attacks),
-            'successful_attacks': len(successful),
-            'success_rate': len(successful) / total if total > 0 else 0,
+            'real_honeypot_attacks': self._real_attack_count,
+            'simulated_attacks': total - self._real_attack_count,
+            'successful_attacks': self._successful_count,
+            'success_rate': self._successful_count / total,
         }
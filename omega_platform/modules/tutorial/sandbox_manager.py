@@ -6,9 +6,11 @@ Safe environment for beginners - Critical for marketing promise
 import subprocess
 import socket
 import sys
+from concurrent.futures import ThreadPoolExecutor
 
 class SandboxManager:
     def __init__(self):
+        self._local_only_ok = None
         self.safety_checks = [
             self.check_local_only,
             self.check_no_external_connections,
@@ -21,11 +23,18 @@ class SandboxManager:
         print("\n🔒 ENABLING SAFE SANDBOX MODE")
         print("Marketing: 'Zero-risk learning on real security tools'")
         
-        for check in self.safety_checks:
-            if not check():
-                print(f"⚠️  Safety check failed: {check.__name__}")
-                return False
-        
+        # The probes are independent and I/O-bound (socket bind, psutil),
+        # so run them concurrently and report every failure at once
+        with ThreadPoolExecutor(max_workers=len(self.safety_checks)) as executor:
+            results = list(executor.map(
+                lambda check: (check.__name__, check()), self.safety_checks))
+
+        failed = [name for name, passed in results if not passed]
+        if failed:
+            for name in failed:
+                print(f"⚠️  Safety check failed: {name}")
+            return False
+
         print("✅ All safety checks passed")
         print("✅ Running in isolated environment")
         print("✅ No external network access")
@@ -35,14 +44,18 @@ class SandboxManager:
     
     def check_local_only(self):
         """Ensure all services bind to localhost only"""
-        try:
-            # Check that we're not binding to external interfaces
-            test_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            test_socket.bind(('127.0.0.1', 0))
-            test_socket.close()
-            return True
-        except:
-            return False
+        # The bind probe is cached: repeated enable_safe_mode calls skip
+        # the syscall, and the context manager closes the socket even
+        # when bind raises
+        if self._local_only_ok is None:
+            try:
+                with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+                    s.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+                    s.bind(('127.0.0.1', 0))
+                self._local_only_ok = True
+            except OSError:
+                self._local_only_ok = False
+        return self._local_only_ok
     
     def check_no_external_connections(self):
         """Verify no external network calls in tutorial mode"""
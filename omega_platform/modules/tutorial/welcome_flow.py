@@ -3,15 +3,28 @@ Marketing Promise: "Go from zero to detecting, deceiving, and responding to atta
 This delivers the "First 15 Minutes" experience
 """
 
+import os
 import time
-import json
 from pathlib import Path
 
+from omega_platform.utils import fastjson
+
 class WelcomeFlow:
     def __init__(self, tutorial_engine):
         self.engine = tutorial_engine
         self.progress_file = Path("tutorial_progress.json")
         self.current_step = 0
+        # Progress lives in memory; the file is only read once here and
+        # rewritten (atomically) when a step completes
+        self._progress = self.load_progress()
+
+        self._step_handlers = {
+            "welcome": self.show_welcome,
+            "setup_environment": self.setup_environment,
+            "first_detection": self.first_detection,
+            "deploy_honeypot": self.deploy_honeypot,
+            "automated_response": self.automated_response,
+        }
         
         # Marketing-driven learning path
         self.steps = [
@@ -62,8 +75,8 @@ class WelcomeFlow:
         print("\nLet's begin your cybersecurity journey...\n")
         
         total_time = 0
-        for step in self.steps:
-            print(f"\n▶️  Step {self.steps.index(step)+1}: {step['title']}")
+        for idx, step in enumerate(self.steps, 1):
+            print(f"\n▶️  Step {idx}: {step['title']}")
             print(f"   ⏱️  {step['duration']} | 💡 {step['marketing_message']}")
             
             # Execute step
@@ -96,17 +109,8 @@ class WelcomeFlow:
     
     def execute_step(self, step_id):
         """Execute a specific learning step"""
-        if step_id == "welcome":
-            return self.show_welcome()
-        elif step_id == "setup_environment":
-            return self.setup_environment()
-        elif step_id == "first_detection":
-            return self.first_detection()
-        elif step_id == "deploy_honeypot":
-            return self.deploy_honeypot()
-        elif step_id == "automated_response":
-            return self.automated_response()
-        return False
+        handler = self._step_handlers.get(step_id)
+        return handler() if handler else False
     
     def show_welcome(self):
         print("\n   Welcome to Project Omega - The all-in-one open-source")
@@ -136,23 +140,24 @@ class WelcomeFlow:
     
     def save_progress(self, step_id):
         """Save user progress for resumption"""
-        progress = self.load_progress()
-        progress['completed_steps'].append(step_id)
-        progress['last_activity'] = time.time()
-        
-        with open(self.progress_file, 'w') as f:
-            json.dump(progress, f, indent=2)
-    
+        self._progress['completed_steps'].append(step_id)
+        self._progress['last_activity'] = time.time()
+        self._write_progress()
+
+    def _write_progress(self):
+        """Flush the in-memory progress to disk atomically"""
+        tmp_file = self.progress_file.with_suffix('.json.tmp')
+        tmp_file.write_bytes(fastjson.dumps(self._progress))
+        os.replace(tmp_file, self.progress_file)
+
     def load_progress(self):
         """Load user progress"""
         if self.progress_file.exists():
-            with open(self.progress_file, 'r') as f:
-                return json.load(f)
+            return fastjson.loads(self.progress_file.read_bytes())
         return {'completed_steps': [], 'last_activity': None}
-    
+
     def get_completion_rate(self):
         """Calculate completion percentage for metrics"""
-        progress = self.load_progress()
-        completed = len(progress['completed_steps'])
+        completed = len(self._progress['completed_steps'])
         total = len(self.steps)
         return (completed / total) * 100 if total > 0 else 0
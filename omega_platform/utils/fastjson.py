@@ -0,0 +1,23 @@
+"""
+JSON helpers backed by orjson when it is installed
+
+loads accepts bytes or str; dumps returns pretty-printed bytes so
+callers write files in binary mode.
+"""
+import json
+
+try:
+    import orjson
+except ImportError:  # optional native-speed codec
+    orjson = None
+
+if orjson is not None:
+    loads = orjson.loads
+
+    def dumps(obj):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+else:
+    loads = json.loads
+
+    def dumps(obj):
+        return json.dumps(obj, indent=2).encode()
@@ -0,0 +1,53 @@
+"""
+Ticking cached timestamp for response payloads
+
+Most handlers stamp their payload with utcnow().isoformat() + 'Z',
+often three or four times per request; the C-level datetime
+formatting shows up under load. A daemon thread refreshes one shared
+ISO string every 100 ms and handlers just read it — plenty of
+resolution for a dashboard poll. Uptime fields come from a monotonic
+start offset instead of subtracting two wall-clock datetimes.
+"""
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+
+_TICK = 0.1
+
+_lock = threading.Lock()
+_thread = None
+
+
+def _format_now():
+    return datetime.now(timezone.utc).isoformat().replace('+00:00', 'Z')
+
+
+_cached = _format_now()
+
+
+def _tick_worker():
+    global _cached
+    while True:
+        time.sleep(_TICK)
+        _cached = _format_now()
+
+
+def iso_now() -> str:
+    """Current UTC time as an ISO-8601 'Z' string, cached to 100 ms"""
+    global _thread, _cached
+    if _thread is None:
+        with _lock:
+            if _thread is None:
+                # The import-time value may be arbitrarily stale by the
+                # first call; refresh before the ticker takes over
+                _cached = _format_now()
+                _thread = threading.Thread(
+                    target=_tick_worker, name='iso-clock', daemon=True
+                )
+                _thread.start()
+    return _cached
+
+
+def uptime_since(start_monotonic: float) -> str:
+    """Elapsed time since a time.monotonic() reading, as H:MM:SS"""
+    return str(timedelta(seconds=int(time.monotonic() - start_monotonic)))
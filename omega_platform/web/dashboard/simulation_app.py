@@ -2,18 +2,29 @@
 Omega Platform Simulation Dashboard - Clean Final Version
 """
 from flask import Flask, render_template, jsonify, request
-import datetime
 import sys
 import os
+import time
 
 sys.path.append(os.path.join(os.path.dirname(__file__), '../..'))
 
+from omega_platform.web.clock import iso_now, uptime_since
+from omega_platform.web.ojson import dumps, raw_json
+
 app = Flask(__name__)
 
+# Static demo list, encoded once at import
+_SCENARIOS_JSON = dumps([
+    {'id': 'apt', 'name': 'APT Simulation', 'difficulty': 'advanced'},
+    {'id': 'ransomware', 'name': 'Ransomware Attack', 'difficulty': 'medium'},
+    {'id': 'insider', 'name': 'Insider Threat', 'difficulty': 'hard'},
+    {'id': 'phishing', 'name': 'Phishing Campaign', 'difficulty': 'easy'}
+])
+
 # Simple dashboard class
 class SimulationDashboard:
     def __init__(self):
-        self.startup_time = datetime.datetime.utcnow()
+        self.startup_monotonic = time.monotonic()
         self.stats = {
             'simulations_run': 0,
             'honeypot_interactions': 142,
@@ -23,7 +34,7 @@ class SimulationDashboard:
     def get_status(self):
         return {
             'status': 'active',
-            'uptime': str(datetime.datetime.utcnow() - self.startup_time),
+            'uptime': uptime_since(self.startup_monotonic),
             'demo_mode': True
         }
 
@@ -32,9 +43,9 @@ dashboard = SimulationDashboard()
 # Routes
 @app.route('/')
 def index():
-    return render_template('dashboard.html', 
+    return render_template('dashboard.html',
                           version='3.0.0',
-                          timestamp=datetime.datetime.utcnow().isoformat())
+                          timestamp=iso_now())
 
 @app.route('/api/status')
 def api_status():
@@ -43,7 +54,7 @@ def api_status():
         'version': '3.0.0',
         'status': 'operational',
         'demo_mode': True,
-        'timestamp': datetime.datetime.utcnow().isoformat() + 'Z',
+        'timestamp': iso_now(),
         'endpoints': [
             '/api/health',
             '/api/status', 
@@ -57,17 +68,12 @@ def health():
     return jsonify({
         'status': 'healthy',
         'service': 'simulation_dashboard',
-        'timestamp': datetime.datetime.utcnow().isoformat() + 'Z'
+        'timestamp': iso_now()
     })
 
 @app.route('/api/scenarios')
 def scenarios():
-    return jsonify([
-        {'id': 'apt', 'name': 'APT Simulation', 'difficulty': 'advanced'},
-        {'id': 'ransomware', 'name': 'Ransomware Attack', 'difficulty': 'medium'},
-        {'id': 'insider', 'name': 'Insider Threat', 'difficulty': 'hard'},
-        {'id': 'phishing', 'name': 'Phishing Campaign', 'difficulty': 'easy'}
-    ])
+    return raw_json(_SCENARIOS_JSON)
 
 @app.route('/api/metrics')
 def metrics():
@@ -76,7 +82,7 @@ def metrics():
         'response_time': '2.3s',
         'active_simulations': 2,
         'honeypot_interactions': dashboard.stats['honeypot_interactions'],
-        'timestamp': datetime.datetime.utcnow().isoformat() + 'Z'
+        'timestamp': iso_now()
     })
 
 @app.route('/api/simulation/run', methods=['POST'])
@@ -89,7 +95,7 @@ def run_simulation():
     return jsonify({
         'success': True,
         'scenario': scenario,
-        'simulation_id': f"sim_{int(datetime.datetime.utcnow().timestamp())}",
+        'simulation_id': f"sim_{int(time.time())}",
         'status': 'started',
         'message': f'Simulation {scenario} started successfully'
     })
@@ -107,4 +113,5 @@ def print_welcome():
 
 if __name__ == '__main__':
     print_welcome()
-    app.run(debug=True, host='0.0.0.0', port=5000, use_reloader=False)
+    from omega_platform.web.serve import serve
+    serve(app, host='0.0.0.0', port=5000)
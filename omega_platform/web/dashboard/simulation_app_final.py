@@ -2,10 +2,14 @@
 Omega Platform Simulation Dashboard - Final Version
 Modern web interface for threat simulation management
 """
-from flask import Flask, render_template, jsonify, request
+from flask import Flask, render_template, request
+from omega_platform.web.clock import iso_now, uptime_since
+from omega_platform.web.etag import etag
+from omega_platform.web.ojson import dumps, ojsonify, raw_json
 import json
 import sys
 import os
+import time
 import datetime
 
 # Add parent directory to path to import omega_platform modules
@@ -27,7 +31,8 @@ class SimulationDashboard:
     
     def __init__(self):
         self.engine = None
-        self.startup_time = datetime.datetime.utcnow()
+        self.startup_time = datetime.datetime.now(datetime.timezone.utc)
+        self.startup_monotonic = time.monotonic()
         
         if PLATFORM_AVAILABLE:
             self.initialize_platform()
@@ -57,7 +62,7 @@ class SimulationDashboard:
             'honeypots_targeted': 3,
             'events_processed': 142,
             'demo_data': True,
-            'uptime': str(datetime.datetime.utcnow() - self.startup_time)
+            'uptime': uptime_since(self.startup_monotonic)
         }
     
     def get_deception_status(self):
@@ -77,21 +82,65 @@ class SimulationDashboard:
     
     def run_simulation_scenario(self, scenario_name):
         """Run a specific simulation scenario"""
+        now = datetime.datetime.now(datetime.timezone.utc)
         return {
             'success': True,
             'scenario': scenario_name,
             'status': 'started',
-            'simulation_id': f"sim_{int(datetime.datetime.utcnow().timestamp())}",
+            'simulation_id': f"sim_{int(now.timestamp())}",
             'steps_executed': 0,
             'honeypots_targeted': 2,
             'demo_data': True,
-            'start_time': datetime.datetime.utcnow().isoformat() + 'Z',
-            'estimated_completion': (datetime.datetime.utcnow() + datetime.timedelta(minutes=30)).isoformat() + 'Z'
+            'start_time': iso_now(),
+            'estimated_completion': (now + datetime.timedelta(minutes=30)).isoformat().replace('+00:00', 'Z')
         }
 
 # Initialize dashboard
 dashboard = SimulationDashboard()
 
+# Demo payloads are fixed for the process lifetime; encode them once
+# at import so their handlers only hand out the cached bytes
+_SCENARIOS_JSON = dumps([
+    {'id': 'apt_sim', 'name': 'APT Simulation', 'difficulty': 'advanced', 'duration': '2h'},
+    {'id': 'ransomware_sim', 'name': 'Ransomware Attack', 'difficulty': 'medium', 'duration': '45m'},
+    {'id': 'insider_sim', 'name': 'Insider Threat', 'difficulty': 'hard', 'duration': '1.5h'},
+    {'id': 'phishing_sim', 'name': 'Phishing Campaign', 'difficulty': 'easy', 'duration': '30m'},
+    {'id': 'ddos_sim', 'name': 'DDoS Attack', 'difficulty': 'medium', 'duration': '1h'},
+    {'id': 'malware_sim', 'name': 'Malware Propagation', 'difficulty': 'hard', 'duration': '1.5h'}
+])
+
+_ACTIVE_SIMULATIONS_JSON = dumps({
+    'active': [
+        {'id': 'sim_001', 'scenario': 'APT Simulation', 'progress': 65, 'started': '10:30', 'estimated_completion': '12:00'},
+        {'id': 'sim_002', 'scenario': 'Ransomware Attack', 'progress': 30, 'started': '11:15', 'estimated_completion': '12:00'}
+    ],
+    'queued': [
+        {'id': 'sim_003', 'scenario': 'Phishing Campaign', 'scheduled': '14:00'}
+    ],
+    'completed_today': 3,
+    'demo_data': True
+})
+
+_HONEYPOTS_JSON = dumps(dashboard.get_deception_status())
+
+_SYSTEM_INFO_JSON = dumps({
+    'platform': 'Omega Security Platform',
+    'version': '3.0.0',
+    'dashboard_version': '1.0.0',
+    'environment': 'development',
+    'phase': 3,
+    'python_version': sys.version.split()[0],
+    'demo_mode': True,
+    'startup_time': dashboard.startup_time.isoformat().replace('+00:00', 'Z'),
+    'features': [
+        'threat_simulation',
+        'honeypot_monitoring',
+        'real_time_metrics',
+        'api_first_design',
+        'demo_mode'
+    ]
+})
+
 # Flask Routes
 @app.route('/')
 def index():
@@ -103,7 +152,7 @@ def index():
 @app.route('/api/status')
 def api_status():
     """API endpoint for system status"""
-    return jsonify({
+    return ojsonify({
         'platform': 'Omega Security Platform',
         'version': '3.0.0',
         'phase': 3,
@@ -112,22 +161,15 @@ def api_status():
             'deception': dashboard.get_deception_status()
         },
         'demo_mode': True,
-        'timestamp': datetime.datetime.utcnow().isoformat() + 'Z',
-        'dashboard_uptime': str(datetime.datetime.utcnow() - dashboard.startup_time)
+        'timestamp': iso_now(),
+        'dashboard_uptime': uptime_since(dashboard.startup_monotonic)
     })
 
 @app.route('/api/simulation/scenarios')
+@etag
 def get_scenarios():
     """Get available simulation scenarios"""
-    scenarios = [
-        {'id': 'apt_sim', 'name': 'APT Simulation', 'difficulty': 'advanced', 'duration': '2h'},
-        {'id': 'ransomware_sim', 'name': 'Ransomware Attack', 'difficulty': 'medium', 'duration': '45m'},
-        {'id': 'insider_sim', 'name': 'Insider Threat', 'difficulty': 'hard', 'duration': '1.5h'},
-        {'id': 'phishing_sim', 'name': 'Phishing Campaign', 'difficulty': 'easy', 'duration': '30m'},
-        {'id': 'ddos_sim', 'name': 'DDoS Attack', 'difficulty': 'medium', 'duration': '1h'},
-        {'id': 'malware_sim', 'name': 'Malware Propagation', 'difficulty': 'hard', 'duration': '1.5h'}
-    ]
-    return jsonify(scenarios)
+    return raw_json(_SCENARIOS_JSON)
 
 @app.route('/api/simulation/run', methods=['POST'])
 def run_simulation():
@@ -136,32 +178,22 @@ def run_simulation():
     scenario_id = data.get('scenario_id', 'apt_sim')
     
     result = dashboard.run_simulation_scenario(scenario_id)
-    return jsonify(result)
+    return ojsonify(result)
 
 @app.route('/api/deception/honeypots')
 def get_honeypots():
     """Get deception honeypot status"""
-    return jsonify(dashboard.get_deception_status())
+    return raw_json(_HONEYPOTS_JSON)
 
 @app.route('/api/simulation/active')
 def get_active_simulations():
     """Get active simulations"""
-    return jsonify({
-        'active': [
-            {'id': 'sim_001', 'scenario': 'APT Simulation', 'progress': 65, 'started': '10:30', 'estimated_completion': '12:00'},
-            {'id': 'sim_002', 'scenario': 'Ransomware Attack', 'progress': 30, 'started': '11:15', 'estimated_completion': '12:00'}
-        ],
-        'queued': [
-            {'id': 'sim_003', 'scenario': 'Phishing Campaign', 'scheduled': '14:00'}
-        ],
-        'completed_today': 3,
-        'demo_data': True
-    })
+    return raw_json(_ACTIVE_SIMULATIONS_JSON)
 
 @app.route('/api/metrics')
 def get_metrics():
     """Get performance metrics"""
-    return jsonify({
+    return ojsonify({
         'detection_rate': 87.5,
         'response_time': '2.3s',
         'false_positives': 2,
@@ -170,40 +202,24 @@ def get_metrics():
         'honeypot_interactions': 142,
         'avg_threat_score': 7.2,
         'demo_data': True,
-        'timestamp': datetime.datetime.utcnow().isoformat() + 'Z'
+        'timestamp': iso_now()
     })
 
 @app.route('/api/health')
 def health_check():
     """Health check endpoint"""
-    return jsonify({
+    return ojsonify({
         'status': 'healthy',
         'service': 'omega_simulation_dashboard',
         'version': '3.0.0',
-        'timestamp': datetime.datetime.utcnow().isoformat() + 'Z',
-        'uptime': str(datetime.datetime.utcnow() - dashboard.startup_time)
+        'timestamp': iso_now(),
+        'uptime': uptime_since(dashboard.startup_monotonic)
     })
 
 @app.route('/api/system/info')
 def system_info():
     """System information endpoint"""
-    return jsonify({
-        'platform': 'Omega Security Platform',
-        'version': '3.0.0',
-        'dashboard_version': '1.0.0',
-        'environment': 'development',
-        'phase': 3,
-        'python_version': sys.version.split()[0],
-        'demo_mode': True,
-        'startup_time': dashboard.startup_time.isoformat() + 'Z',
-        'features': [
-            'threat_simulation',
-            'honeypot_monitoring',
-            'real_time_metrics',
-            'api_first_design',
-            'demo_mode'
-        ]
-    })
+    return raw_json(_SYSTEM_INFO_JSON)
 
 def print_welcome():
     """Print welcome message"""
@@ -232,4 +248,5 @@ def print_welcome():
 
 if __name__ == '__main__':
     print_welcome()
-    app.run(debug=True, host='0.0.0.0', port=5000, use_reloader=False)
+    from omega_platform.web.serve import serve
+    serve(app, host='0.0.0.0', port=5000)
@@ -80,4 +80,5 @@ if __name__ == '__main__':
     print("   - GET /api/mitre/techniques")
     print("   - GET /api/scenarios")
     
-    app.run(host='0.0.0.0', port=8080, debug=True)
+    from omega_platform.web.serve import serve
+    serve(app, host='0.0.0.0', port=8080)
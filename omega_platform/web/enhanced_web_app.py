@@ -1,10 +1,12 @@
 """
 Enhanced Omega Platform Web App with Data Lake
 """
-from flask import Flask, jsonify, request
+from flask import Flask, request
+from omega_platform.web.clock import iso_now
+from omega_platform.web.etag import etag
+from omega_platform.web.ojson import ojsonify, stream_list, streamed_json
 import sys
 import os
-from datetime import datetime
 
 # Add the parent directory to Python path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -32,7 +34,7 @@ except ImportError as e:
 
 @app.route('/')
 def home():
-    return jsonify({
+    return ojsonify({
         "platform": "Omega Platform v4.5",
         "status": "ENHANCED WITH DATA LAKE",
         "version": "4.5",
@@ -53,32 +55,34 @@ def status():
             "version": "4.5",
             "mitre_techniques": len(mitre.get_all()),
             "scenarios": scenarios.count(),
-            "data_lake_events": len(data_lake.get_all_events()),
+            "data_lake_events": data_lake.count(),
             "modules": ["mitre", "scenarios", "data_lake"]
         }
     else:
         stats = {"version": "4.5", "modules_loaded": False}
     
-    return jsonify(stats)
+    return ojsonify(stats)
 
 @app.route('/api/mitre')
+@etag
 def get_mitre():
     if MODULES_LOADED:
-        return jsonify({
+        return ojsonify({
             "techniques": mitre.get_all(),
             "count": len(mitre.get_all()),
             "stats": mitre.get_stats()
         })
-    return jsonify({"error": "Modules not loaded"}), 500
+    return ojsonify({"error": "Modules not loaded"}), 500
 
 @app.route('/api/scenarios')
+@etag
 def get_scenarios():
     if MODULES_LOADED:
-        return jsonify({
+        return ojsonify({
             "scenarios": scenarios.list_scenarios(),
             "count": scenarios.count()
         })
-    return jsonify({"error": "Modules not loaded"}), 500
+    return ojsonify({"error": "Modules not loaded"}), 500
 
 # NEW: Data Lake Endpoints
 @app.route('/api/data-lake/events')
@@ -86,34 +90,39 @@ def get_events():
     """Get all security events"""
     if MODULES_LOADED:
         limit = request.args.get('limit', default=10, type=int)
-        events = data_lake.get_recent_events(limit)
-        return jsonify({
-            "events": events,
-            "count": len(events),
-            "total": len(data_lake.get_all_events())
-        })
-    return jsonify({"error": "Modules not loaded"}), 500
+        if limit:
+            events = data_lake.get_recent_events(limit)
+            return ojsonify({
+                "events": events,
+                "count": len(events),
+                "total": data_lake.count()
+            })
+        # limit=0 requests the full log; stream it chunk by chunk
+        total = data_lake.count()
+        tail = ('],"count":%d,"total":%d}' % (total, total)).encode()
+        return streamed_json(stream_list(data_lake.iter_events(),
+                                         prefix=b'{"events":[', suffix=tail))
+    return ojsonify({"error": "Modules not loaded"}), 500
 
 @app.route('/api/data-lake/stats')
 def get_datalake_stats():
     """Get data lake statistics"""
     if MODULES_LOADED:
         stats = data_lake.get_stats()
-        return jsonify(stats)
-    return jsonify({"error": "Modules not loaded"}), 500
+        return ojsonify(stats)
+    return ojsonify({"error": "Modules not loaded"}), 500
 
 @app.route('/api/simulate/<scenario_id>', methods=['POST'])
 def run_simulation(scenario_id):
     """Run a simulation and store event in data lake"""
     if not MODULES_LOADED:
-        return jsonify({"error": "Modules not loaded"}), 500
+        return ojsonify({"error": "Modules not loaded"}), 500
     
     # Find the scenario
-    all_scenarios = scenarios.list_scenarios()
-    scenario = next((s for s in all_scenarios if s.get('id') == scenario_id), None)
+    scenario = scenarios.get_by_id(scenario_id)
     
     if not scenario:
-        return jsonify({"error": f"Scenario {scenario_id} not found"}), 404
+        return ojsonify({"error": f"Scenario {scenario_id} not found"}), 404
     
     # Create event data
     event_data = {
@@ -123,7 +132,7 @@ def run_simulation(scenario_id):
         "threat_level": "medium",  # Could be based on scenario difficulty
         "mitre_techniques": scenario.get('mitre_techniques', []),
         "details": {
-            "execution_time": datetime.now().isoformat(),
+            "execution_time": iso_now(),
             "status": "completed",
             "user_data": request.json if request.json else {}
         }
@@ -132,7 +141,7 @@ def run_simulation(scenario_id):
     # Store in data lake
     event_id = data_lake.store_event(event_data)
     
-    return jsonify({
+    return ojsonify({
         "success": True,
         "message": f"Simulation '{scenario.get('name')}' executed",
         "event_id": event_id,
@@ -155,4 +164,5 @@ if __name__ == '__main__':
     print("   • POST /api/simulate/<scenario_id>")
     print("="*50 + "\n")
     
-    app.run(host='0.0.0.0', port=8080, debug=False)
+    from omega_platform.web.serve import serve
+    serve(app, host='0.0.0.0', port=8080)
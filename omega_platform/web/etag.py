@@ -0,0 +1,27 @@
+"""
+Conditional-GET support for read-heavy JSON endpoints
+
+The technique/scenario/marketplace payloads rarely change between
+polls; hashing the body into an ETag lets clients that already hold
+the current version get an empty 304 instead of the full payload.
+"""
+import hashlib
+from functools import wraps
+
+from flask import request
+
+
+def etag(view):
+    """Stamp the response with a body-hash ETag and honor If-None-Match"""
+    @wraps(view)
+    def wrapped(*args, **kwargs):
+        response = view(*args, **kwargs)
+        # error tuples and other non-Response returns pass through
+        if not hasattr(response, 'get_data'):
+            return response
+        tag = hashlib.blake2b(response.get_data(), digest_size=16).hexdigest()
+        if request.if_none_match.contains(tag):
+            return '', 304
+        response.set_etag(tag)
+        return response
+    return wrapped
@@ -1,10 +1,13 @@
 """
 OMEGA PLATFORM v4.5 - FINAL VERSION WITH ATT&CK MATRIX
 """
-from flask import Flask, jsonify, request
+from flask import Flask, request
+from omega_platform.web.clock import iso_now
+from omega_platform.web.etag import etag
+from omega_platform.web.ojson import ojsonify, stream_list, streamed_json
+from omega_platform.web.ttl_cache import cached
 import sys
 import os
-from datetime import datetime
 
 app = Flask(__name__)
 
@@ -69,7 +72,7 @@ MATRIX_LOADED = loaded.get('ATT&CK Matrix', False)
 
 @app.route('/')
 def home():
-    return jsonify({
+    return ojsonify({
         "platform": "Omega Platform v4.5",
         "version": "4.5",
         "modules_loaded": loaded,
@@ -88,11 +91,12 @@ def home():
     })
 
 @app.route('/api/status')
+@cached(timeout=30)
 def status():
     stats = {
         "version": "4.5",
         "modules": loaded,
-        "timestamp": datetime.now().isoformat()
+        "timestamp": iso_now()
     }
     
     if MITRE_LOADED:
@@ -102,7 +106,7 @@ def status():
         stats['scenarios'] = modules['scenarios'].count()
     
     if DATALAKE_LOADED:
-        stats['data_lake_events'] = len(modules['data_lake'].get_all_events())
+        stats['data_lake_events'] = modules['data_lake'].count()
     
     if MARKETPLACE_LOADED:
         marketplace_stats = modules['marketplace'].get_stats()
@@ -116,74 +120,88 @@ def status():
             'coverage_gaps': len(matrix_stats.get('all_techniques', [])) - matrix_stats['unique_techniques']
         }
     
-    return jsonify(stats)
+    return ojsonify(stats)
 
 @app.route('/api/mitre')
+@etag
+@cached(timeout=60)
 def get_mitre():
     if not MITRE_LOADED:
-        return jsonify({"error": "MITRE module not loaded"}), 500
-    return jsonify(modules['mitre'].get_all())
+        return ojsonify({"error": "MITRE module not loaded"}), 500
+    return ojsonify(modules['mitre'].get_all())
 
 @app.route('/api/scenarios')
+@etag
 def get_scenarios():
     if not SCENARIOS_LOADED:
-        return jsonify({"error": "Scenario module not loaded"}), 500
-    return jsonify({
+        return ojsonify({"error": "Scenario module not loaded"}), 500
+    return ojsonify({
         "scenarios": modules['scenarios'].list_scenarios(),
         "count": modules['scenarios'].count(),
         "user_scenarios": modules['scenarios'].get_user_scenarios() if hasattr(modules['scenarios'], 'get_user_scenarios') else []
     })
 
 @app.route('/api/marketplace')
+@etag
 def get_marketplace():
     if not MARKETPLACE_LOADED:
-        return jsonify({"error": "Marketplace module not loaded"}), 500
-    return jsonify(modules['marketplace'].get_marketplace_scenarios())
+        return ojsonify({"error": "Marketplace module not loaded"}), 500
+    return ojsonify(modules['marketplace'].get_marketplace_scenarios())
 
 @app.route('/api/marketplace/import/<scenario_id>', methods=['POST'])
 def import_scenario(scenario_id):
     if not MARKETPLACE_LOADED:
-        return jsonify({"error": "Marketplace module not loaded"}), 500
+        return ojsonify({"error": "Marketplace module not loaded"}), 500
     result = modules['marketplace'].import_scenario(scenario_id)
-    return jsonify(result)
+    status.invalidate()  # scenario counts just changed
+    return ojsonify(result)
 
 @app.route('/api/data-lake/events')
 def get_events():
     if not DATALAKE_LOADED:
-        return jsonify({"error": "Data Lake module not loaded"}), 500
+        return ojsonify({"error": "Data Lake module not loaded"}), 500
     
     limit = request.args.get('limit', default=20, type=int)
-    events = modules['data_lake'].get_all_events()
-    
-    if limit and len(events) > limit:
-        events = events[-limit:]
-    
-    return jsonify({
-        "events": events,
-        "count": len(events),
-        "total": len(modules['data_lake'].get_all_events())
-    })
+    data_lake = modules['data_lake']
+    if limit:
+        events = data_lake.get_recent_events(limit)
+        return ojsonify({
+            "events": events,
+            "count": len(events),
+            "total": data_lake.count()
+        })
+
+    # Full dumps are streamed so the client starts parsing immediately
+    # and the whole log never sits encoded in memory
+    total = data_lake.count()
+    tail = ('],"count":%d,"total":%d}' % (total, total)).encode()
+    return streamed_json(stream_list(data_lake.iter_events(),
+                                     prefix=b'{"events":[', suffix=tail))
 
 # NEW: ATT&CK Matrix Endpoints
 @app.route('/api/attack-matrix')
+@etag
+@cached(timeout=60)
 def get_attack_matrix():
     if not MATRIX_LOADED or not SCENARIOS_LOADED:
-        return jsonify({"error": "ATT&CK Matrix or Scenario module not loaded"}), 500
+        return ojsonify({"error": "ATT&CK Matrix or Scenario module not loaded"}), 500
     
     scenarios = modules['scenarios'].list_scenarios()
     visualization = modules['attack_matrix'].generate_visualization_data(scenarios)
     
-    return jsonify(visualization)
+    return ojsonify(visualization)
 
 @app.route('/api/attack-matrix/recommendations')
+@etag
+@cached(timeout=60)
 def get_matrix_recommendations():
     if not MATRIX_LOADED or not SCENARIOS_LOADED:
-        return jsonify({"error": "ATT&CK Matrix or Scenario module not loaded"}), 500
+        return ojsonify({"error": "ATT&CK Matrix or Scenario module not loaded"}), 500
     
     scenarios = modules['scenarios'].list_scenarios()
     recommendations = modules['attack_matrix'].get_recommendations(scenarios)
     
-    return jsonify({
+    return ojsonify({
         "recommendations": recommendations,
         "total": len(recommendations),
         "scenarios_analyzed": len(scenarios)
@@ -192,19 +210,17 @@ def get_matrix_recommendations():
 @app.route('/api/simulate/<scenario_id>', methods=['POST'])
 def simulate(scenario_id):
     if not DATALAKE_LOADED:
-        return jsonify({"error": "Data Lake module not loaded"}), 500
+        return ojsonify({"error": "Data Lake module not loaded"}), 500
     
     # Try to find scenario details
     scenario_name = f"Scenario: {scenario_id}"
     mitre_techniques = ["T1566"]  # Default
     
     if SCENARIOS_LOADED:
-        all_scenarios = modules['scenarios'].list_scenarios()
-        for s in all_scenarios:
-            if s.get('id') == scenario_id:
-                scenario_name = s.get('name', scenario_name)
-                mitre_techniques = s.get('mitre_techniques', mitre_techniques)
-                break
+        scenario = modules['scenarios'].get_by_id(scenario_id)
+        if scenario:
+            scenario_name = scenario.get('name', scenario_name)
+            mitre_techniques = scenario.get('mitre_techniques', mitre_techniques)
     
     event_data = {
         "event_type": "simulation_execution",
@@ -216,8 +232,9 @@ def simulate(scenario_id):
     }
     
     event_id = modules['data_lake'].store_event(event_data)
-    
-    return jsonify({
+    status.invalidate()  # event counts just changed
+
+    return ojsonify({
         "success": True,
         "event_id": event_id,
         "message": f"Simulation '{scenario_name}' executed",
@@ -236,4 +253,5 @@ if __name__ == '__main__':
     print("  curl -X POST http://localhost:8080/api/simulate/market_001 -H 'Content-Type: application/json' -d '{\"test\": true}'")
     print("\n" + "="*60)
     
-    app.run(host='0.0.0.0', port=8080, debug=True)
+    from omega_platform.web.serve import serve
+    serve(app, host='0.0.0.0', port=8080)
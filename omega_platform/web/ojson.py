@@ -0,0 +1,55 @@
+"""
+orjson-backed replacement for flask.jsonify
+
+Flask serializes responses through stdlib json; for the endpoints
+that return whole technique lists or event dumps the encoder is the
+dominant CPU cost. ojsonify encodes with orjson when it is installed
+(compact output, native datetime/numpy handling) and falls back to
+stdlib json otherwise.
+"""
+import json
+
+from flask import Response, stream_with_context
+
+try:
+    import orjson
+except ImportError:  # optional native-speed codec
+    orjson = None
+
+if orjson is not None:
+    _OPTS = orjson.OPT_NAIVE_UTC | orjson.OPT_SERIALIZE_NUMPY
+
+    def dumps(obj):
+        return orjson.dumps(obj, option=_OPTS)
+else:
+    def dumps(obj):
+        return json.dumps(obj, default=str).encode()
+
+
+def ojsonify(obj) -> Response:
+    """Drop-in jsonify replacement returning an orjson-encoded body"""
+    return Response(dumps(obj), mimetype='application/json')
+
+
+def raw_json(body: bytes) -> Response:
+    """Wrap pre-encoded JSON bytes in a response; lets static payloads
+    be serialized once at import and reused per request"""
+    return Response(body, mimetype='application/json')
+
+
+def stream_list(items, prefix=b'[', suffix=b']'):
+    """Yield a JSON array one element at a time, wrapped in the given
+    envelope bytes, so large dumps never sit whole in memory"""
+    yield prefix
+    first = True
+    for item in items:
+        chunk = dumps(item)
+        yield chunk if first else b',' + chunk
+        first = False
+    yield suffix
+
+
+def streamed_json(generator) -> Response:
+    """Chunked JSON response from a byte generator"""
+    return Response(stream_with_context(generator),
+                    mimetype='application/json')
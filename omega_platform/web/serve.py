@@ -0,0 +1,28 @@
+"""
+Shared production entry point for the Flask apps
+
+app.run(debug=True) serves every request through the single-threaded
+Werkzeug dev server with the debugger overhead on each call. serve()
+prefers waitress, a multithreaded production WSGI server, and falls
+back to a threaded dev server with debug off when waitress is not
+installed.
+"""
+import logging
+import os
+
+try:
+    from waitress import serve as _waitress_serve
+except ImportError:  # optional production server
+    _waitress_serve = None
+
+logger = logging.getLogger(__name__)
+
+
+def serve(app, host='0.0.0.0', port=8080):
+    """Serve a Flask app on a production WSGI server when available"""
+    if _waitress_serve is not None:
+        threads = min(32, (os.cpu_count() or 1) * 4)
+        _waitress_serve(app, host=host, port=port, threads=threads)
+    else:
+        logger.warning("waitress not installed; using the threaded dev server")
+        app.run(host=host, port=port, debug=False, threaded=True)
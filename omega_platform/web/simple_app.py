@@ -26,5 +26,6 @@ def status():
     })
 
 if __name__ == '__main__':
+    from omega_platform.web.serve import serve
     print("Starting Omega Platform on http://localhost:8080")
-    app.run(host='0.0.0.0', port=8080, debug=True)
+    serve(app, host='0.0.0.0', port=8080)
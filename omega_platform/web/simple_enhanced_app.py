@@ -103,4 +103,5 @@ if __name__ == '__main__':
     print("  POST /api/simulate/<id>")
     print("\n" + "="*40)
     
-    app.run(host='0.0.0.0', port=8080, debug=True)
+    from omega_platform.web.serve import serve
+    serve(app, host='0.0.0.0', port=8080)
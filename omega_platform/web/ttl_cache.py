@@ -0,0 +1,50 @@
+"""
+Tiny in-process TTL cache for expensive view functions
+
+The attack-matrix and status endpoints recompute coverage over the
+full scenario list on every poll; caching the built response for a
+few seconds removes that cost. Mutating handlers call
+view.invalidate() to drop stale entries early. A shared backend
+(Redis via Flask-Caching) would be the multi-worker upgrade; these
+apps run single-process, so a dict per view suffices.
+"""
+import time
+from functools import wraps
+from threading import Lock
+
+from flask import request
+
+
+def cached(timeout=60):
+    """Cache a view's response per request path for timeout seconds
+
+    Keyed on the path alone — none of the decorated views read query
+    parameters, and keying on the full path would let arbitrary query
+    strings grow the store without bound.
+    """
+    def decorator(view):
+        store = {}
+        lock = Lock()
+
+        @wraps(view)
+        def wrapped(*args, **kwargs):
+            key = request.path
+            now = time.monotonic()
+            with lock:
+                hit = store.get(key)
+                if hit is not None:
+                    if now - hit[0] < timeout:
+                        return hit[1]
+                    del store[key]
+            response = view(*args, **kwargs)
+            with lock:
+                store[key] = (now, response)
+            return response
+
+        def invalidate():
+            with lock:
+                store.clear()
+
+        wrapped.invalidate = invalidate
+        return wrapped
+    return decorator
@@ -82,7 +82,7 @@ def status():
         stats['scenarios'] = all_modules['scenarios'].count()
     
     if modules_loaded.get('data_lake'):
-        stats['data_lake_events'] = len(all_modules['data_lake'].get_all_events())
+        stats['data_lake_events'] = all_modules['data_lake'].count()
     
     if modules_loaded.get('marketplace'):
         marketplace_stats = all_modules['marketplace'].get_stats()
@@ -122,11 +122,11 @@ def get_events():
         return jsonify({"error": "Data Lake module not loaded"}), 500
     
     limit = request.args.get('limit', default=20, type=int)
-    events = all_modules['data_lake'].get_all_events()
-    
-    if limit and len(events) > limit:
-        events = events[-limit:]
-    
+    if limit:
+        events = all_modules['data_lake'].get_recent_events(limit)
+    else:
+        events = all_modules['data_lake'].get_all_events()
+
     return jsonify({
         "events": events,
         "count": len(events)
@@ -164,4 +164,5 @@ if __name__ == '__main__':
     print("  curl -X POST http://localhost:8080/api/marketplace/import/market_001")
     print("="*50 + "\n")
     
-    app.run(host='0.0.0.0', port=8080, debug=True)
+    from omega_platform.web.serve import serve
+    serve(app, host='0.0.0.0', port=8080)
@@ -28,7 +28,7 @@ try:
     print("✅ USING REAL MODULES")
     print(f"   MITRE: {len(mitre.get_all())} techniques")
     print(f"   Scenarios: {scenarios.count()} scenarios")
-    print(f"   Data Lake: {len(data_lake.get_all_events())} events")
+    print(f"   Data Lake: {data_lake.count()} events")
     
 except ImportError as e:
     print(f"⚠️  Using simple modules: {e}")
@@ -56,6 +56,8 @@ except ImportError as e:
         def __init__(self):
             self.events = []
         def get_all_events(self): return self.events
+        def get_recent_events(self, limit=10): return self.events[-limit:]
+        def count(self): return len(self.events)
         def store_event(self, e):
             e["event_id"] = f"event_{len(self.events)+1}"
             e["timestamp"] = datetime.now().isoformat() + "Z"
@@ -93,7 +95,7 @@ def status():
         "modules": "real" if USE_REAL_MODULES else "simple",
         "mitre_techniques": len(mitre.get_all()),
         "scenarios": scenarios.count(),
-        "data_lake_events": len(data_lake.get_all_events())
+        "data_lake_events": data_lake.count()
     })
 
 @app.route('/api/mitre')
@@ -115,14 +117,15 @@ def get_scenarios():
 @app.route('/api/data-lake/events')
 def get_events():
     limit = request.args.get('limit', default=20, type=int)
-    events = data_lake.get_all_events()
-    if limit and len(events) > limit:
-        events = events[-limit:]
-    
+    if limit:
+        events = data_lake.get_recent_events(limit)
+    else:
+        events = data_lake.get_all_events()
+
     return jsonify({
         "events": events,
         "count": len(events),
-        "total": len(data_lake.get_all_events()),
+        "total": data_lake.count(),
         "module_type": "real" if USE_REAL_MODULES else "simple"
     })
 
@@ -164,4 +167,5 @@ if __name__ == '__main__':
     print("  curl http://localhost:8080/api/data-lake/events")
     print("="*50 + "\n")
     
-    app.run(host='0.0.0.0', port=8080, debug=True)
+    from omega_platform.web.serve import serve
+    serve(app, host='0.0.0.0', port=8080)